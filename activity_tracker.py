@@ -1,17 +1,18 @@
 # activity_tracker.py
-import win32api
 import win32gui
 import win32process
 import psutil
-from ctypes import windll, Structure, c_ulong, byref, sizeof
+from ctypes import WinDLL, WINFUNCTYPE, POINTER, Structure, c_ulong, c_uint64, byref, sizeof, create_unicode_buffer, wintypes
+import sys
 import time
 import asyncio
+import logging
 from config import Config
 from logger import Logger
 import concurrent.futures
 import threading
 import gc
-import weakref
+from collections import OrderedDict
 
 # Import Windows Media Control API
 try:
@@ -29,49 +30,257 @@ try:
 except ImportError:
     TOAST_AVAILABLE = False
 
+# Activity polling interval bounds (milliseconds)
+ACTIVITY_POLL_BASE_MS = 200
+ACTIVITY_POLL_MAX_MS = 1000
+
+# Seconds a media playback result is reused before querying the API again
+MEDIA_CACHE_TTL = 2.0
+
+# Upper bound in seconds for the delay between probes of an unresponsive media API
+MEDIA_PROBE_MAX_BACKOFF = 60
+
+# Number of resolved window handles kept when polling the foreground window
+HWND_CACHE_SIZE = 64
+
 class LASTINPUTINFO(Structure):
     _fields_ = [
         ('cbSize', c_ulong),
         ('dwTime', c_ulong)
     ]
 
+# Direct kernel32 bindings for resolving a process image name without psutil
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+MAX_PATH = 260
+
+_kernel32 = WinDLL('kernel32', use_last_error=True)
+_OpenProcess = _kernel32.OpenProcess
+_OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+_OpenProcess.restype = wintypes.HANDLE
+_QueryFullProcessImageNameW = _kernel32.QueryFullProcessImageNameW
+_QueryFullProcessImageNameW.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR, wintypes.PDWORD]
+_QueryFullProcessImageNameW.restype = wintypes.BOOL
+_CloseHandle = _kernel32.CloseHandle
+_CloseHandle.argtypes = [wintypes.HANDLE]
+_CloseHandle.restype = wintypes.BOOL
+
+# WinEvent hook bindings for event-driven foreground window tracking
+EVENT_SYSTEM_FOREGROUND = 0x0003
+WINEVENT_OUTOFCONTEXT = 0x0000
+WM_QUIT = 0x0012
+
+WinEventProcType = WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+)
+
+_user32 = WinDLL('user32', use_last_error=True)
+_SetWinEventHook = _user32.SetWinEventHook
+_SetWinEventHook.argtypes = [
+    wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProcType,
+    wintypes.DWORD, wintypes.DWORD, wintypes.DWORD
+]
+_SetWinEventHook.restype = wintypes.HANDLE
+_UnhookWinEvent = _user32.UnhookWinEvent
+_UnhookWinEvent.argtypes = [wintypes.HANDLE]
+_UnhookWinEvent.restype = wintypes.BOOL
+_GetMessageW = _user32.GetMessageW
+_GetMessageW.argtypes = [wintypes.LPMSG, wintypes.HWND, wintypes.UINT, wintypes.UINT]
+_GetMessageW.restype = wintypes.BOOL
+_TranslateMessage = _user32.TranslateMessage
+_TranslateMessage.argtypes = [wintypes.LPMSG]
+_TranslateMessage.restype = wintypes.BOOL
+_DispatchMessageW = _user32.DispatchMessageW
+_DispatchMessageW.argtypes = [wintypes.LPMSG]
+_DispatchMessageW.restype = wintypes.LPARAM
+_PostThreadMessageW = _user32.PostThreadMessageW
+_PostThreadMessageW.argtypes = [wintypes.DWORD, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
+_PostThreadMessageW.restype = wintypes.BOOL
+_GetCurrentThreadId = _kernel32.GetCurrentThreadId
+_GetCurrentThreadId.argtypes = []
+_GetCurrentThreadId.restype = wintypes.DWORD
+
+# Idle-time bindings, called on every activity check
+_GetLastInputInfo = _user32.GetLastInputInfo
+_GetLastInputInfo.argtypes = [POINTER(LASTINPUTINFO)]
+_GetLastInputInfo.restype = wintypes.BOOL
+_GetTickCount64 = _kernel32.GetTickCount64
+_GetTickCount64.argtypes = []
+_GetTickCount64.restype = c_uint64
+
+# Per-thread image name buffers, get_process_name runs on both the hook and polling threads
+_name_buffers = threading.local()
+
+def get_process_name(pid):
+    """Return the executable name for a process id.
+    
+    Uses QueryFullProcessImageNameW directly and falls back to psutil
+    if the process cannot be opened with limited query rights.
+    
+    Args:
+        pid (int): Process id
+        
+    Returns:
+        str: Executable base name, or an empty string if unavailable
+    """
+    handle = _OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if handle:
+        try:
+            buf = getattr(_name_buffers, 'buf', None)
+            if buf is None:
+                buf = _name_buffers.buf = create_unicode_buffer(MAX_PATH)
+            size = wintypes.DWORD(MAX_PATH)
+            if _QueryFullProcessImageNameW(handle, 0, buf, byref(size)):
+                return buf.value.rsplit('\\', 1)[-1]
+        finally:
+            _CloseHandle(handle)
+    return psutil.Process(pid).name()
+
 class ActivityTracker:
     """Tracks user activity and active window information."""
     
+    __slots__ = (
+        'config', 'logger', '_debug_enabled', 'check_activity',
+        '_inactivity_threshold', '_inactivity_threshold_ms',
+        'media_mode_enabled', 'media_programs', '_media_programs_lower',
+        'require_media_playback', '_last_media_check', '_last_logged_process',
+        '_hwnd_cache', '_foreground_state',
+        '_hook_thread', '_hook_thread_id', '_win_event_proc',
+        'last_input_info', '_lii_ref', 'is_active', '_idle_streak',
+        'previous_window_info', 'previous_media_status', 'is_media_playing', 'current_window_info',
+        '_media_cache', '_media_cache_time', '_media_cache_ttl', '_next_media_probe_time',
+        'media_api_status', 'last_api_failure_time', 'api_failure_count', 'api_notification_shown',
+        'toaster', '_toast', '_notify_executor', '_loop', '_loop_thread', '_media_manager',
+        '_media_events_active', '_cached_media_info', '_media_state_lock', '_watched_session',
+        '_session_changed_token', '_playback_token', '_properties_token',
+    )
+    
     def __init__(self):
         self.config = Config()
         self.logger = Logger()
+        # Checked before building per-tick debug messages
+        self._debug_enabled = self.logger.is_enabled_for(logging.DEBUG)
         self.inactivity_threshold = self.config.get('inactivity_threshold')
         self.media_mode_enabled = self.config.get('media_mode_enabled', False)
-        self.media_programs = self.config.get('media_programs', []) or []  # Ensure it's always a list
+        self.update_media_programs(self.config.get('media_programs', []))
         self.require_media_playback = self.config.get('require_media_playback', True)
-        # Convert class variable to instance variable
+        self._subscribe_to_config()
+        self._bind_check_activity()
         self._last_logged_process = ""
+        # hwnd -> process name for recently resolved windows, least recently used first
+        self._hwnd_cache = OrderedDict()
         self._initialize_tracking()
-        # Log media configuration at startup if media mode is enabled
-        if self.media_mode_enabled:
-            self.log_media_programs()
         # Track previous window info to reduce redundant logging
         self.previous_window_info = ""
         self.previous_media_status = False
         self.is_media_playing = False
+        # Number of consecutive checks with no window or activity change
+        self._idle_streak = 0
+        
+        # Last media playback result, reused for MEDIA_CACHE_TTL seconds
+        self._media_cache = (False, None)
+        self._media_cache_time = 0.0
+        self._media_cache_ttl = MEDIA_CACHE_TTL
+        # While the API is unresponsive, don't poll it again before this monotonic time
+        self._next_media_probe_time = 0.0
         
         # API status tracking
         self.media_api_status = "Unknown"  # Can be "Unknown", "Available", "Unresponsive"
-        self.last_api_failure_time = 0
+        self.last_api_failure_time = None  # time.monotonic() of the last notification
         self.api_failure_count = 0
         self.api_notification_shown = False
         
+        # Log media configuration at startup if media mode is enabled
+        if self.media_mode_enabled:
+            self.log_media_programs()
+        
         # Initialize toast notifier if available
         if TOAST_AVAILABLE:
             self.toaster = WindowsToaster("TokiKanri")
+            # Reused for every notification, only the message changes
+            self._toast = Toast()
         else:
             self.toaster = None
+            self._toast = None
+        # Single worker for toast notifications, created on first use
+        self._notify_executor = None
+        
+    @property
+    def inactivity_threshold(self):
+        """Seconds without input before the user is considered inactive."""
+        return self._inactivity_threshold
+        
+    @inactivity_threshold.setter
+    def inactivity_threshold(self, seconds):
+        self._inactivity_threshold = seconds
+        # Compared directly against tick deltas in check_activity
+        self._inactivity_threshold_ms = int((seconds or 0) * 1000)
+        
+    def update_media_programs(self, media_programs):
+        """Set the media programs list and rebuild the lowercase lookup sets.
+        
+        Args:
+            media_programs (list): Executable names considered media programs
+        """
+        self.media_programs = list(media_programs or [])  # Own copy, config list may be edited in place
+        # Sanitized once here so lookups never need to handle encoding errors
+        self._media_programs_lower = frozenset(
+            sys.intern(p.encode('utf-8', errors='replace').decode('utf-8', errors='replace').lower())
+            for p in self.media_programs if p
+        )
+        # Last (process_name, is_media) result, invalidated when the list changes
+        self._last_media_check = (None, False)
+        
+    def _subscribe_to_config(self):
+        """Keep tracker settings in sync with Config without re-reading it."""
+        self.config.subscribe('inactivity_threshold', self._on_inactivity_threshold_changed)
+        self.config.subscribe('media_mode_enabled', self._on_media_mode_changed)
+        self.config.subscribe('require_media_playback', self._on_require_media_playback_changed)
+        self.config.subscribe('media_programs', self._on_media_programs_changed)
+        
+    def reload_settings(self):
+        """Re-apply all tracker settings from the current configuration."""
+        self._debug_enabled = self.logger.is_enabled_for(logging.DEBUG)
+        self._on_inactivity_threshold_changed(self.config.get('inactivity_threshold'))
+        self._on_media_mode_changed(self.config.get('media_mode_enabled', False))
+        self._on_require_media_playback_changed(self.config.get('require_media_playback', True))
+        self._on_media_programs_changed(self.config.get('media_programs', []))
         
-        # Track event loops and async resources
-        self._current_media_task = None
-        self._event_loop = None
-        self._executor = None
+    def _on_inactivity_threshold_changed(self, value):
+        """Config callback for inactivity_threshold"""
+        self.inactivity_threshold = value
+        
+    def _on_media_mode_changed(self, enabled):
+        """Config callback for media_mode_enabled"""
+        enabled = bool(enabled)
+        if enabled == self.media_mode_enabled:
+            return
+        self.logger.info(f"Media mode changed: {self.media_mode_enabled} -> {enabled}")
+        self.media_mode_enabled = enabled
+        self._bind_check_activity()
+        if enabled:
+            self.log_media_programs()
+            
+    def _on_require_media_playback_changed(self, required):
+        """Config callback for require_media_playback"""
+        required = bool(required)
+        if required == self.require_media_playback:
+            return
+        self.logger.info(f"Require media playback changed: {self.require_media_playback} -> {required}")
+        self.require_media_playback = required
+        self._bind_check_activity()
+        if not required:
+            self.logger.info("Media programs will be considered active regardless of playback status")
+        else:
+            self.logger.info("Media programs will only be considered active when media is playing")
+            
+    def _on_media_programs_changed(self, media_programs):
+        """Config callback for media_programs"""
+        media_programs = media_programs or []
+        if set(media_programs) == set(self.media_programs):
+            return
+        self.update_media_programs(media_programs)
+        self.log_media_programs()
         
     def log_media_programs(self):
         """Log the current media programs list for debugging.
@@ -85,54 +294,96 @@ class ActivityTracker:
             self.logger.info(f"Require media playback: {self.require_media_playback}")
             if MEDIA_API_AVAILABLE:
                 self.logger.info("Windows Media Control API is available")
-                self.media_api_status = "Available"
+                self._set_media_api_status("Available")
             else:
                 self.logger.warning("Windows Media Control API is not available")
-                self.media_api_status = "Unavailable"
+                self._set_media_api_status("Unavailable")
         else:
             self.logger.warning("No media programs configured in settings")
         
     def _initialize_tracking(self):
         """Initialize tracking variables."""
         try:
-            self.last_mouse_pos = win32api.GetCursorPos()
             self.last_input_info = LASTINPUTINFO()
             self.last_input_info.cbSize = sizeof(self.last_input_info)
-            windll.user32.GetLastInputInfo(byref(self.last_input_info))
+            # Reused for every GetLastInputInfo call instead of a new byref per tick
+            self._lii_ref = byref(self.last_input_info)
+            _GetLastInputInfo(self._lii_ref)
             self.is_active = True  # Assume active at start
         except Exception as e:
             self.logger.error(f"Error initializing tracking: {Logger.format_error(e)}")
             self.is_active = False
             
-    def _ensure_clean_event_loop(self):
-        """Ensure we have a clean event loop for async operations.
+        # Long-lived event loop for media API calls, reused across checks
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name="MediaEventLoop", daemon=True)
+        self._loop_thread.start()
+        # MediaManager obtained from request_async(), cached after the first call
+        self._media_manager = None
         
-        Returns:
-            asyncio.AbstractEventLoop: A clean event loop for async operations
+        # Media state pushed by WinRT session events once subscribed
+        self._media_events_active = False
+        self._cached_media_info = None
+        # Guards the two fields above, written from the loop thread and read by activity checks
+        self._media_state_lock = threading.Lock()
+        self._watched_session = None
+        self._session_changed_token = None
+        self._playback_token = None
+        self._properties_token = None
+        
+        # Foreground window reported by the WinEvent hook (None until the hook is running)
+        # (hwnd, process_name) written as one tuple by the hook thread; process_name
+        # is None when the window couldn't be resolved yet
+        self._foreground_state = None
+        self._hook_thread_id = None
+        self._win_event_proc = WinEventProcType(self._on_foreground_event)  # Keep a reference for the hook
+        self._hook_thread = threading.Thread(target=self._run_foreground_hook, daemon=True)
+        self._hook_thread.start()
+        
+    def _run_foreground_hook(self):
+        """Register the foreground WinEvent hook and pump messages for it.
+        
+        Runs on its own thread; out-of-context hooks are delivered through
+        this thread's message queue.
         """
         try:
-            # Try to get the current event loop
+            self._hook_thread_id = _GetCurrentThreadId()
+            hook = _SetWinEventHook(
+                EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND,
+                None, self._win_event_proc, 0, 0, WINEVENT_OUTOFCONTEXT
+            )
+            if not hook:
+                self.logger.warning("Could not register foreground window hook, falling back to polling")
+                return
+            
+            # Seed with the current foreground window before any event arrives
+            self._update_foreground_state(win32gui.GetForegroundWindow())
+            
             try:
-                loop = asyncio.get_event_loop()
-                # If the loop is closed, create a new one
-                if loop.is_closed():
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-            except RuntimeError:
-                # If no event loop exists, create a new one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                
-            # Keep track of the current event loop
-            self._event_loop = loop
-            return loop
+                msg = wintypes.MSG()
+                while _GetMessageW(byref(msg), None, 0, 0) > 0:
+                    _TranslateMessage(byref(msg))
+                    _DispatchMessageW(byref(msg))
+            finally:
+                _UnhookWinEvent(hook)
+                self._foreground_state = None
+        except Exception as e:
+            self.logger.error(f"Error in foreground window hook: {Logger.format_error(e)}")
+            self._foreground_state = None
+            
+    def _on_foreground_event(self, hWinEventHook, event, hwnd, idObject, idChild, dwEventThread, dwmsEventTime):
+        """WinEvent callback for EVENT_SYSTEM_FOREGROUND."""
+        self._update_foreground_state(hwnd)
+        
+    def _update_foreground_state(self, hwnd):
+        """Resolve the process for a new foreground window on the hook thread."""
+        try:
+            process_name = self._resolve_window_process(hwnd)
         except Exception as e:
-            self.logger.error(f"Error ensuring clean event loop: {Logger.format_error(e)}")
-            # Create a new event loop as a last resort
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            self._event_loop = loop
-            return loop
+            self.logger.warning(f"Error resolving foreground window: {Logger.format_error(e)}")
+            process_name = ""
+        # Leave unresolved windows (e.g. no title yet) for get_active_window_info to retry
+        self._foreground_state = (hwnd, process_name or None)
 
     def show_api_notification(self, message):
         """Show a notification about API status.
@@ -141,31 +392,32 @@ class ActivityTracker:
             message (str): The notification message to display
         """
         # Only show notification if we haven't shown one recently (within 5 minutes)
-        current_time = time.time()
-        if current_time - self.last_api_failure_time > 300:  # 5 minutes
+        current_time = time.monotonic()
+        if self.last_api_failure_time is None or current_time - self.last_api_failure_time > 300:  # 5 minutes
             self.api_notification_shown = True
             self.last_api_failure_time = current_time
             
             # Show Windows toast notification if available
             if TOAST_AVAILABLE and self.toaster is not None:
-                threading.Thread(
-                    target=self._show_toast_notification,
-                    args=(message,),
-                    daemon=True
-                ).start()
+                if self._notify_executor is None:
+                    self._notify_executor = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix='toast'
+                    )
+                self._notify_executor.submit(self._show_toast_notification, message)
                 
     def _show_toast_notification(self, message):
-        """Show Windows toast notification in a separate thread.
+        """Show Windows toast notification on the notification worker.
         
         Args:
             message (str): The message to display in the toast notification
         """
         try:
             # Only attempt to show toast if toaster is not None
+            # Toasts are shown one at a time on the notification worker, so the
+            # shared Toast can be updated without a lock
             if self.toaster is not None:
-                toast = Toast()
-                toast.text_fields = ["TokiKanri Media Mode", message]
-                self.toaster.show_toast(toast)
+                self._toast.text_fields = ["TokiKanri Media Mode", message]
+                self.toaster.show_toast(self._toast)
         except Exception as e:
             self.logger.error(f"Error showing toast notification: {Logger.format_error(e)}")
 
@@ -179,18 +431,12 @@ class ActivityTracker:
             dict or None: Media information if available, None otherwise
         """
         try:
-            # Create a task for the media info request
-            task = asyncio.create_task(self.get_media_info())
-            
-            # Keep a reference to cancel it if needed
-            self._current_media_task = task
-            
-            # Wait for the task to complete with a timeout
-            result = await asyncio.wait_for(task, timeout=timeout)
+            # wait_for cancels the request itself if it times out
+            result = await asyncio.wait_for(self.get_media_info(), timeout=timeout)
             
             # If we get here, API is responsive
             if self.media_api_status == "Unresponsive":
-                self.media_api_status = "Available"
+                self._set_media_api_status("Available")
                 self.api_failure_count = 0
                 self.show_api_notification("Windows Media Control API is now responsive again")
                 
@@ -200,7 +446,7 @@ class ActivityTracker:
             self.logger.warning(f"Media API call timed out after {timeout} seconds")
             
             # Update API status
-            self.media_api_status = "Unresponsive"
+            self._set_media_api_status("Unresponsive")
             self.api_failure_count += 1
             
             # Show notification if this is a recurring issue (3 failures)
@@ -211,19 +457,94 @@ class ActivityTracker:
         except Exception as e:
             self.logger.error(f"Error in media API call: {Logger.format_error(e)}")
             return None
-        finally:
-            # Clean up the task if it's still running
-            if self._current_media_task and not self._current_media_task.done():
-                self._current_media_task.cancel()
-                try:
-                    # Try to await the canceled task to properly clean up
-                    await asyncio.wait_for(self._current_media_task, timeout=0.1)
-                except (asyncio.CancelledError, asyncio.TimeoutError):
-                    pass
-                except Exception:
-                    pass
-            self._current_media_task = None
             
+    async def _ensure_media_manager(self):
+        """Return the cached session manager, requesting it on first use.
+        
+        The first request also subscribes to session change events so later
+        playback checks can read pushed state instead of polling.
+        
+        Returns:
+            MediaManager: The session manager
+        """
+        if self._media_manager is None:
+            self._media_manager = await MediaManager.request_async()
+            try:
+                self._session_changed_token = self._media_manager.add_current_session_changed(
+                    self._on_current_session_changed
+                )
+                await self._watch_session(self._media_manager.get_current_session())
+                # Only trust the cache once the first snapshot is stored
+                with self._media_state_lock:
+                    self._media_events_active = True
+            except asyncio.CancelledError:
+                # Timed out halfway through; undo the partial subscription and retry on the next call
+                self._unsubscribe_media_events()
+                self._media_manager = None
+                raise
+            except Exception as e:
+                self.logger.warning(f"Could not subscribe to media session events, polling instead: {Logger.format_error(e)}")
+                self._unsubscribe_media_events()
+        return self._media_manager
+        
+    async def _watch_session(self, session):
+        """Move playback and properties subscriptions to a new current session.
+        
+        Args:
+            session: The current media session, or None if there is none
+        """
+        self._unwatch_session()
+        self._watched_session = session
+        if session is None:
+            with self._media_state_lock:
+                self._cached_media_info = None
+            return
+        self._playback_token = session.add_playback_info_changed(self._on_media_session_event)
+        self._properties_token = session.add_media_properties_changed(self._on_media_session_event)
+        await self._refresh_cached_media_info()
+        
+    def _unwatch_session(self):
+        """Remove event handlers from the currently watched session."""
+        session = self._watched_session
+        if session is not None:
+            try:
+                if self._playback_token is not None:
+                    session.remove_playback_info_changed(self._playback_token)
+                if self._properties_token is not None:
+                    session.remove_media_properties_changed(self._properties_token)
+            except Exception:
+                pass
+        self._watched_session = None
+        self._playback_token = None
+        self._properties_token = None
+        
+    def _unsubscribe_media_events(self):
+        """Remove all media event handlers and fall back to polling."""
+        with self._media_state_lock:
+            self._media_events_active = False
+            self._cached_media_info = None
+        self._unwatch_session()
+        if self._media_manager is not None and self._session_changed_token is not None:
+            try:
+                self._media_manager.remove_current_session_changed(self._session_changed_token)
+            except Exception:
+                pass
+        self._session_changed_token = None
+        
+    def _on_current_session_changed(self, sender, args):
+        """WinRT handler for CurrentSessionChanged (runs on a WinRT thread)."""
+        asyncio.run_coroutine_threadsafe(self._watch_session(sender.get_current_session()), self._loop)
+        
+    def _on_media_session_event(self, sender, args):
+        """WinRT handler for PlaybackInfoChanged/MediaPropertiesChanged (runs on a WinRT thread)."""
+        asyncio.run_coroutine_threadsafe(self._refresh_cached_media_info(), self._loop)
+        
+    async def _refresh_cached_media_info(self):
+        """Re-read the current session into the cached media info."""
+        media_info = await self.get_media_info()
+        with self._media_state_lock:
+            self._cached_media_info = media_info
+        
     async def get_media_info(self):
         """Get information about currently playing media using Windows Media Control API.
         
@@ -234,11 +555,8 @@ class ActivityTracker:
             self.logger.debug("Windows Media Control API not available")
             return None
             
-        sessions = None
-        current_session = None
-            
         try:
-            sessions = await MediaManager.request_async()
+            sessions = await self._ensure_media_manager()
             current_session = sessions.get_current_session()
             
             if current_session:
@@ -257,23 +575,67 @@ class ActivityTracker:
                     'status': status
                 }
                 
-                self.logger.debug(f"Media info: {media_info}")
+                if self._debug_enabled:
+                    self.logger.debug(f"Media info: {media_info}")
                 return media_info
             else:
-                self.logger.debug("No active media session found")
+                if self._debug_enabled:
+                    self.logger.debug("No active media session found")
                 return None
         except Exception as e:
             self.logger.error(f"Error getting media info: {Logger.format_error(e)}")
+            # Drop the cached manager so the next check requests a fresh one
+            self._unsubscribe_media_events()
+            self._media_manager = None
             return None
+            
+    def _set_media_api_status(self, status):
+        """Update media_api_status, dropping the cached playback result on a transition"""
+        if status != self.media_api_status:
+            self.media_api_status = status
+            self._media_cache = (False, None)
+            self._media_cache_time = 0.0
+            
+    def _poll_media_info(self):
+        """Request media info from the API on the media event loop.
+        
+        Returns
+        -------
+        tuple
+            (ok, media_info) where ok is False if the request failed or timed out
+        """
+        future = None
+        try:
+            # Schedule the request on the long-lived event loop
+            future = asyncio.run_coroutine_threadsafe(
+                self._get_media_info_with_timeout(timeout=1.5),
+                self._loop
+            )
+            
+            # Wait for the future to complete with a timeout
+            return True, future.result(timeout=2.0)
+            
+        except concurrent.futures.TimeoutError:
+            self.logger.warning("Media playback check timed out")
+            
+            # Update API status
+            self._set_media_api_status("Unresponsive")
+            self.api_failure_count += 1
+            
+            # Show notification if this is a recurring issue (3 failures)
+            if self.api_failure_count >= 3 and not self.api_notification_shown:
+                self.show_api_notification("Windows Media Control API is unresponsive. Media detection may not work properly.")
+                
+            return False, None
+            
+        except Exception as e:
+            self.logger.error(f"Error in media playback thread: {Logger.format_error(e)}")
+            return False, None
+            
         finally:
-            # Explicitly clear references to help garbage collection
-            # These objects come from COM/WinRT and need explicit cleanup
-            if current_session:
-                current_session = None
-            if sessions:
-                sessions = None
-            # Force a garbage collection cycle to help clean up COM objects
-            gc.collect()
+            # Cancel the future if it's still running to prevent lingering threads
+            if future and not future.done():
+                future.cancel()
             
     def check_media_playback(self):
         """Check if media is currently playing
@@ -286,71 +648,44 @@ class ActivityTracker:
         if not self.media_mode_enabled or not MEDIA_API_AVAILABLE:
             return False, None
             
+        now = time.monotonic()
         try:
-            # Use a thread-safe approach with timeout to prevent hanging
-            media_info = None
-            
-            # Create executor only when needed and reuse it
-            if self._executor is None or self._executor._shutdown:
-                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-            
-            # Use a finite timeout to avoid blocking forever
-            executor = self._executor
-            future = None
-            
-            try:
-                # Create a clean event loop for each check to avoid resource leaks
-                def run_async_task():
-                    # Set up a clean event loop
-                    loop = self._ensure_clean_event_loop()
-                    try:
-                        # Run the async task in this thread's event loop
-                        return loop.run_until_complete(self._get_media_info_with_timeout(timeout=1.5))
-                    finally:
-                        # Don't close the loop as it may be reused
-                        pass
-                
-                # Submit the task to the executor
-                future = executor.submit(run_async_task)
-                
-                # Wait for the future to complete with a timeout
-                media_info = future.result(timeout=2.0)
-                
-            except concurrent.futures.TimeoutError:
-                self.logger.warning("Media playback check timed out")
-                
-                # Update API status
-                self.media_api_status = "Unresponsive"
-                self.api_failure_count += 1
-                
-                # Show notification if this is a recurring issue (3 failures)
-                if self.api_failure_count >= 3 and not self.api_notification_shown:
-                    self.show_api_notification("Windows Media Control API is unresponsive. Media detection may not work properly.")
-                    
-                return False, None
-                
-            except Exception as e:
-                self.logger.error(f"Error in media playback thread: {Logger.format_error(e)}")
-                return False, None
-                
-            finally:
-                # Cancel the future if it's still running to prevent lingering threads
-                if future and not future.done():
-                    future.cancel()
+            with self._media_state_lock:
+                events_active = self._media_events_active
+                media_info = self._cached_media_info
+            # With session events active the cached info is already current, no API call needed
+            if not events_active:
+                if now - self._media_cache_time < self._media_cache_ttl or now < self._next_media_probe_time:
+                    # Playback state changes on a scale of seconds, reuse a recent result
+                    return self._media_cache
+                ok, media_info = self._poll_media_info()
+                if self.media_api_status == "Unresponsive":
+                    # Each probe can block for the full timeout, back off exponentially
+                    backoff = min(2 ** self.api_failure_count, MEDIA_PROBE_MAX_BACKOFF)
+                    self._next_media_probe_time = time.monotonic() + backoff
+                else:
+                    self._next_media_probe_time = 0.0
+                if not ok:
+                    return False, None
             
             if media_info and media_info.get('status', '').upper() == 'PLAYING':
                 self.is_media_playing = True
-                self.logger.debug(f"Media is playing: {media_info.get('title', 'Unknown')} - {media_info.get('artist', 'Unknown')}")
-                return True, media_info
+                if self._debug_enabled:
+                    self.logger.debug(f"Media is playing: {media_info.get('title', 'Unknown')} - {media_info.get('artist', 'Unknown')}")
+                self._media_cache = (True, media_info)
+                self._media_cache_time = now
+                return self._media_cache
             else:
                 # When media is not playing, immediately update the status
                 was_playing = self.is_media_playing
                 self.is_media_playing = False
                 if was_playing:
                     self.logger.info(f"Media stopped playing. Status: {media_info.get('status', 'Unknown') if media_info else 'No media info'}")
-                elif media_info:
+                elif media_info and self._debug_enabled:
                     self.logger.debug(f"Media is not playing. Status: {media_info.get('status', 'Unknown')}")
-                return False, media_info
+                self._media_cache = (False, media_info)
+                self._media_cache_time = now
+                return self._media_cache
         except Exception as e:
             self.logger.error(f"Error checking media playback: {Logger.format_error(e)}")
             return False, None
@@ -369,233 +704,315 @@ class ActivityTracker:
             True if the process is a media program, False otherwise
         """
         if not process_name:
-            self.logger.debug("No process name provided")
+            if self._debug_enabled:
+                self.logger.debug("No process name provided")
             return False
             
         if not self.media_mode_enabled:
-            self.logger.debug("Media mode is disabled")
+            if self._debug_enabled:
+                self.logger.debug("Media mode is disabled")
             return False
             
+        # Same process as the last lookup, reuse its result
+        last_name, last_result = self._last_media_check
+        if process_name == last_name:
+            return last_result
+            
         # Only log when process_name is different from previous check
-        if process_name != self.previous_window_info:
+        if self._debug_enabled and process_name != self.previous_window_info:
             self.logger.debug(f"Checking if '{process_name}' is in media programs list: {self.media_programs}")
         
-        try:
-            process_lower = process_name.lower()
-            for prog in self.media_programs:
-                try:
-                    prog_lower = prog.lower()
-                    # Only log detailed comparison for new window checks
-                    if process_name != self.previous_window_info:
-                        self.logger.debug(f"Comparing '{process_lower}' with '{prog_lower}'")
-                    if prog_lower == process_lower:
-                        # Only log match if it's a new match
-                        if process_name != self.previous_window_info or not self.previous_media_status:
-                            self.logger.info(f"Media program match: '{process_name}' matches '{prog}'")
-                        return True
-                except UnicodeError:
-                    # Handle Unicode errors in program names
-                    self.logger.warning(f"Unicode error when comparing with program: {prog}")
-                    # Try with safe representation
-                    try:
-                        safe_prog = prog.encode('utf-8', errors='replace').decode('utf-8', errors='replace').lower()
-                        safe_process = process_name.encode('utf-8', errors='replace').decode('utf-8', errors='replace').lower()
-                        if safe_prog == safe_process:
-                            # Only log match if it's a new match
-                            if process_name != self.previous_window_info or not self.previous_media_status:
-                                self.logger.info(f"Media program match (safe comparison): '{process_name}' matches '{prog}'")
-                            return True
-                    except Exception as e:
-                        self.logger.error(f"Failed to compare process names: {Logger.format_error(e)}")
-        except UnicodeError:
-            self.logger.warning(f"Unicode error when processing: {process_name}")
-            return False
+        is_match = process_name.lower() in self._media_programs_lower
+        self._last_media_check = (process_name, is_match)
+        
+        if is_match:
+            # Only log match if it's a new match
+            if process_name != self.previous_window_info or not self.previous_media_status:
+                self.logger.info(f"Media program match: '{process_name}'")
+            return True
                 
         # Only log non-match for new window checks
-        if process_name != self.previous_window_info:
+        if self._debug_enabled and process_name != self.previous_window_info:
             self.logger.debug(f"'{process_name}' is not in the media programs list")
         return False
         
-    def check_activity(self):
-        """Check current user activity status
+    def _next_poll_delay(self, state_changed, is_media_program):
+        """Return the suggested delay before the next activity check.
+        
+        The delay doubles for every unchanged check up to ACTIVITY_POLL_MAX_MS
+        and drops back to ACTIVITY_POLL_BASE_MS on any change or while a
+        media program is in the foreground.
         
+        Args:
+            state_changed (bool): Whether the window or activity state changed
+            is_media_program (bool): Whether the foreground program is a media program
+            
         Returns:
-            bool: True if activity state changed, False otherwise
+            int: Delay in milliseconds
         """
+        if state_changed or is_media_program:
+            self._idle_streak = 0
+            return ACTIVITY_POLL_BASE_MS
+        self._idle_streak += 1
+        return min(ACTIVITY_POLL_BASE_MS * 2 ** min(self._idle_streak, 4), ACTIVITY_POLL_MAX_MS)
+        
+    def _bind_check_activity(self):
+        """Pick the check_activity variant that matches the current settings.
+        
+        Media mode, playback verification and API availability only change
+        through settings, so the per-tick method is chosen here instead of
+        branching on them every check.
+        """
+        if not self.media_mode_enabled:
+            self.check_activity = self._check_activity_plain
+        elif self.require_media_playback and MEDIA_API_AVAILABLE:
+            self.check_activity = self._check_activity_media_verified
+        else:
+            self.check_activity = self._check_activity_media_unverified
+            
+    def _input_received(self):
+        """Return True if user input was received within the inactivity threshold"""
         try:
-            # Get the current active window info
-            current_window_info = self.get_active_window_info()
+            # Read the input time first so the uptime taken after it can't be older
+            _GetLastInputInfo(self._lii_ref)
+            system_uptime = _GetTickCount64()
+            # dwTime is the low 32 bits of the tick count, extend it against the 64-bit uptime
+            last_input = (system_uptime & ~0xFFFFFFFF) | self.last_input_info.dwTime
+            if last_input - system_uptime > 1 << 31:
+                # Low 32 bits wrapped since the input, it belongs to the previous epoch
+                last_input -= 1 << 32
+            # A slightly-ahead input time is input that just happened
+            idle_ms = max(0, system_uptime - last_input)
+            return idle_ms < self._inactivity_threshold_ms
+        except Exception as e:
+            self.logger.warning(f"Could not get input info: {Logger.format_error(e)}")
+            return False
+            
+    def _apply_input_activity(self, current_window_info, was_active, window_changed):
+        """Set the activity state from user input (GetLastInputInfo covers mouse movement as well)"""
+        input_received = self._input_received()
+        self.is_active = input_received
+        if self._debug_enabled and current_window_info and (window_changed or was_active != input_received):
+            self.logger.debug(f"Regular activity check for {current_window_info}: input_received={input_received}, is_active={input_received}")
             
-            # Store previous active state to detect changes
+    def _get_media_display_info(self):
+        """Return (is_playing, title, artist, status) for the current media session"""
+        media_info = None
+        is_playing = False
+        if MEDIA_API_AVAILABLE:
+            try:
+                is_playing, media_info = self.check_media_playback()
+            except Exception as e:
+                self.logger.error(f"Error checking media playback: {Logger.format_error(e)}")
+                is_playing = False
+                media_info = None
+                
+        # Ensure media_info is not None to prevent attribute errors
+        if media_info is None:
+            return is_playing, 'Unknown', 'Unknown', 'Unknown'
+        return (
+            is_playing,
+            media_info.get('title', 'Unknown'),
+            media_info.get('artist', 'Unknown'),
+            media_info.get('status', 'Unknown'),
+        )
+        
+    def _finish_activity_check(self, current_window_info, was_active, window_changed, is_media_program):
+        """Store this tick's state for the next comparison and return (changed, next_delay)"""
+        activity_changed = was_active != self.is_active
+        next_delay = self._next_poll_delay(activity_changed or window_changed, is_media_program)
+        
+        # Update previous window info and media status for next comparison
+        self.previous_window_info = current_window_info
+        self.previous_media_status = is_media_program
+        
+        return activity_changed, next_delay
+        
+    def _check_activity_plain(self):
+        """check_activity variant used while media mode is disabled
+        
+        Returns:
+            tuple: (changed, next_delay) where changed is True if the activity
+            state changed and next_delay is the suggested delay in milliseconds
+            before the next check
+        """
+        try:
+            current_window_info = self.get_active_window_info()
             was_active = self.is_active
+            # Window names are interned, so this is an identity check on the steady path
+            window_changed = current_window_info is not self.previous_window_info and current_window_info != self.previous_window_info
             
-            # Check if we're in media mode and the current program is a media program
-            is_media_program = False
-            if current_window_info:
-                is_media_program = self.is_media_program(current_window_info)
+            self._apply_input_activity(current_window_info, was_active, window_changed)
+            return self._finish_activity_check(current_window_info, was_active, window_changed, False)
             
-            try:
-                # Get mouse position to check for activity
-                try:
-                    current_mouse_pos = win32api.GetCursorPos()
-                    mouse_moved = current_mouse_pos != self.last_mouse_pos
-                    self.last_mouse_pos = current_mouse_pos
-                except Exception as e:
-                    self.logger.warning(f"Could not get cursor position: {Logger.format_error(e)}")
-                    current_mouse_pos = self.last_mouse_pos
-                    mouse_moved = False
+        except Exception as e:
+            self.logger.error(f"Error checking activity: {Logger.format_error(e)}")
+            return False, ACTIVITY_POLL_BASE_MS
+            
+    def _check_activity_media_verified(self):
+        """check_activity variant for media mode when media must be playing
+        
+        Returns:
+            tuple: (changed, next_delay), see _check_activity_plain
+        """
+        try:
+            current_window_info = self.get_active_window_info()
+            was_active = self.is_active
+            is_media_program = bool(current_window_info) and self.is_media_program(current_window_info)
+            window_changed = current_window_info is not self.previous_window_info and current_window_info != self.previous_window_info
+            
+            if not is_media_program:
+                self._apply_input_activity(current_window_info, was_active, window_changed)
+            else:
+                state_changed = window_changed or not self.previous_media_status
+                is_playing, title, artist, status = self._get_media_display_info()
                 
-                # Check for user input
-                try:
-                    system_uptime = win32api.GetTickCount()
-                    windll.user32.GetLastInputInfo(byref(self.last_input_info))
-                    idle_time = (system_uptime - self.last_input_info.dwTime) / 1000.0
-                    input_received = idle_time < self.inactivity_threshold
-                except Exception as e:
-                    self.logger.warning(f"Could not get input info: {Logger.format_error(e)}")
-                    input_received = False
+                # One log line per transition, nothing while the state holds
+                if is_playing:
+                    self.is_active = True
+                    if not was_active:
+                        self.logger.info(f"Media mode activated tracking for {current_window_info} - Now playing: \"{title} - {artist}\"")
+                    elif state_changed:
+                        self.logger.info(f"Media is playing in {current_window_info} - Now playing: \"{title} - {artist}\"")
+                else:
+                    # If media is not playing, immediately set to inactive
+                    self.is_active = False
+                    if was_active:
+                        self.logger.info(f"Media stopped playing in {current_window_info} - Status: {status}")
+                    elif state_changed:
+                        self.logger.info(f"Media is not playing in {current_window_info} - Status: {status}")
+                        
+            return self._finish_activity_check(current_window_info, was_active, window_changed, is_media_program)
+            
+        except Exception as e:
+            self.logger.error(f"Error checking activity: {Logger.format_error(e)}")
+            return False, ACTIVITY_POLL_BASE_MS
+            
+    def _check_activity_media_unverified(self):
+        """check_activity variant for media mode when playback is not verified
+        
+        Media programs count as active regardless of playback status, either
+        because the setting is off or because the media API is unavailable.
+        
+        Returns:
+            tuple: (changed, next_delay), see _check_activity_plain
+        """
+        try:
+            current_window_info = self.get_active_window_info()
+            was_active = self.is_active
+            is_media_program = bool(current_window_info) and self.is_media_program(current_window_info)
+            window_changed = current_window_info is not self.previous_window_info and current_window_info != self.previous_window_info
+            
+            if not is_media_program:
+                self._apply_input_activity(current_window_info, was_active, window_changed)
+            else:
+                self.is_active = True
+                state_changed = window_changed or not self.previous_media_status
                 
-                # If we're in media mode and this is a media program
-                if is_media_program:
-                    # Get media info for display purposes if API is available
-                    media_info = None
-                    is_playing = False
-                    if MEDIA_API_AVAILABLE:
-                        try:
-                            is_playing, media_info = self.check_media_playback()
-                        except Exception as e:
-                            self.logger.error(f"Error checking media playback: {Logger.format_error(e)}")
-                            is_playing = False
-                            media_info = None
-                    
-                    # Ensure media_info is not None to prevent attribute errors
-                    if media_info is None:
-                        media_info = {'title': 'Unknown', 'artist': 'Unknown', 'status': 'Unknown'}
-                    
-                    # Format media info for display
-                    title = media_info.get('title', 'Unknown')
-                    artist = media_info.get('artist', 'Unknown')
-                    status = media_info.get('status', 'Unknown')
+                # Playback doesn't affect activity here, only query it for the log messages
+                if state_changed or not was_active:
+                    _, title, artist, status = self._get_media_display_info()
                     
-                    # Check if we need to verify media playback
-                    if self.require_media_playback and MEDIA_API_AVAILABLE:
-                        if is_playing:
-                            self.is_active = True
-                            if current_window_info != self.previous_window_info or self.previous_media_status != is_media_program:
-                                self.logger.info(f"Media is playing in {current_window_info} - Now playing: \"{title} - {artist}\"")
-                            if not was_active:
-                                self.logger.info(f"Media mode activated tracking for {current_window_info} - Now playing: \"{title} - {artist}\"")
-                        else:
-                            # If media is not playing, immediately set to inactive
-                            self.is_active = False
-                            if was_active:
-                                self.logger.info(f"Media stopped playing in {current_window_info} - Status: {status}")
-                            elif current_window_info != self.previous_window_info or self.previous_media_status != is_media_program:
-                                self.logger.info(f"Media is not playing in {current_window_info} - Status: {status}")
+                    # Format media info string if available
+                    if title and artist and title != 'Unknown' and artist != 'Unknown':
+                        media_str = f" - Media info: \"{title} - {artist}\" ({status})"
+                    elif status != 'Unknown':
+                        media_str = f" - Media status: {status}"
                     else:
-                        # If we don't need to verify media playback or API isn't available, consider active
-                        # regardless of playback status
-                        self.is_active = True
+                        media_str = ""
                         
-                        # Format media info string if available
-                        if title and artist and title != 'Unknown' and artist != 'Unknown':
-                            media_str = f" - Media info: \"{title} - {artist}\" ({status})"
-                        elif status != 'Unknown':
-                            media_str = f" - Media status: {status}"
-                        else:
-                            media_str = ""
+                    # One log line per transition
+                    if not was_active:
+                        self.logger.info(f"Media mode activated tracking for {current_window_info}{media_str}")
+                    else:
+                        self.logger.info(f"Media mode active for {current_window_info}{media_str} - Activity status: True")
                         
-                        if current_window_info != self.previous_window_info or self.previous_media_status != is_media_program:
-                            self.logger.info(f"Media mode active for {current_window_info}{media_str} - Activity status: {self.is_active}")
-                        if not was_active:
-                            self.logger.info(f"Media mode activated tracking for {current_window_info}{media_str}")
-                else:
-                    self.is_active = mouse_moved or input_received
-                    if current_window_info and (current_window_info != self.previous_window_info or was_active != self.is_active):
-                        self.logger.debug(f"Regular activity check for {current_window_info}: mouse_moved={mouse_moved}, input_received={input_received}, is_active={self.is_active}")
-                
-                # Update previous window info and media status for next comparison
-                self.previous_window_info = current_window_info
-                self.previous_media_status = is_media_program
-                
-                # Return True if activity state changed, False otherwise
-                return was_active != self.is_active
-                
-            except Exception as e:
-                self.logger.error(f"Error in activity check logic: {Logger.format_error(e)}")
-                return False
-                
+            return self._finish_activity_check(current_window_info, was_active, window_changed, is_media_program)
+            
         except Exception as e:
             self.logger.error(f"Error checking activity: {Logger.format_error(e)}")
-            return False
+            return False, ACTIVITY_POLL_BASE_MS
             
     def get_active_window_info(self):
         """Get information about the currently active window"""
         try:
-            hwnd = win32gui.GetForegroundWindow()
+            # The WinEvent hook resolves the process on its own thread, poll only if it isn't running
+            state = self._foreground_state
+            if state is not None:
+                hwnd, process_name = state
+                if process_name is not None:
+                    return process_name
+            else:
+                hwnd = win32gui.GetForegroundWindow()
             
-            # Get window title with proper Unicode handling
-            try:
-                window_title = win32gui.GetWindowText(hwnd)
-            except UnicodeError:
-                # Create a temporary logger for error reporting
-                temp_logger = Logger()
-                temp_logger.warning("Unicode error when getting window title")
-                # Use a safe representation
-                window_title = ""
-            
-            # Filter out empty windows or invalid handles
-            if hwnd and window_title:
-                try:
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    process = psutil.Process(pid)
-                    
-                    try:
-                        process_name = process.name()
-                        if not process_name:
-                            return ""
-                            
-                        # Only log when process changes
-                        if process_name != self._last_logged_process:
-                            self.logger.debug(f"Active window: {window_title} ({process_name})")
-                            self._last_logged_process = process_name
-                            
-                        return process_name
-                    except UnicodeError:
-                        # Create a temporary logger for error reporting
-                        temp_logger = Logger()
-                        temp_logger.warning("Unicode error when getting process name")
-                        # Use a safe representation
-                        try:
-                            safe_name = process.name().encode('utf-8', errors='replace').decode('utf-8', errors='replace')
-                            return safe_name
-                        except Exception as e:
-                            temp_logger.error(f"Failed to get safe process name: {Logger.format_error(e)}")
-                            return ""
-                except Exception as e:
-                    # Create a temporary logger for error reporting
-                    temp_logger = Logger()
-                    temp_logger.warning(f"Error getting process info: {Logger.format_error(e)}")
-                    return ""
+            # Window resolved before, skip the process lookup
+            process_name = self._hwnd_cache.get(hwnd)
+            if process_name is not None:
+                self._hwnd_cache.move_to_end(hwnd)
+                return process_name
+            
+            process_name = self._resolve_window_process(hwnd)
+            if process_name:
+                self._hwnd_cache[hwnd] = process_name
+                if len(self._hwnd_cache) > HWND_CACHE_SIZE:
+                    self._hwnd_cache.popitem(last=False)
+            return process_name
+        except Exception as e:
+            self.logger.error(f"Error getting window info: {Logger.format_error(e)}")
+            return ""
+            
+    def _resolve_window_process(self, hwnd):
+        """Return the interned process name owning hwnd, or "" if it has no usable title or process"""
+        # Get window title with proper Unicode handling
+        try:
+            window_title = win32gui.GetWindowText(hwnd)
+        except UnicodeError:
+            self.logger.warning("Unicode error when getting window title")
+            # Use a safe representation
+            window_title = ""
+        
+        # Filter out empty windows or invalid handles
+        if not (hwnd and window_title):
             return ""
+            
+        try:
+            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            process_name = get_process_name(pid)
+            if not process_name:
+                return ""
+            process_name = sys.intern(process_name)
+                
+            # Only log when process changes
+            if process_name != self._last_logged_process:
+                if self._debug_enabled:
+                    self.logger.debug(f"Active window: {window_title} ({process_name})")
+                self._last_logged_process = process_name
+            return process_name
         except Exception as e:
-            # Create a temporary logger for error reporting
-            temp_logger = Logger()
-            temp_logger.error(f"Error getting window info: {Logger.format_error(e)}")
+            self.logger.warning(f"Error getting process info: {Logger.format_error(e)}")
             return ""
             
     def cleanup_resources(self):
         """Explicitly clean up resources when the tracker is no longer needed"""
         try:
-            # Cancel any running media task
-            if self._current_media_task and not self._current_media_task.done():
-                self._current_media_task.cancel()
-            self._current_media_task = None
-            
-            # Shutdown the executor if it exists
-            if self._executor:
-                self._executor.shutdown(wait=False)
-            self._executor = None
+            # Remove media event handlers and stop the media event loop
+            self._unsubscribe_media_events()
+            if self._loop.is_running():
+                self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout=2.0)
+            if not self._loop.is_running() and not self._loop.is_closed():
+                self._loop.close()
+            self._media_manager = None
+            
+            # Let a pending toast finish on its own, don't block shutdown on it
+            if self._notify_executor is not None:
+                self._notify_executor.shutdown(wait=False)
+                self._notify_executor = None
+            
+            # Stop the foreground hook message loop
+            if self._hook_thread_id:
+                _PostThreadMessageW(self._hook_thread_id, WM_QUIT, 0, 0)
+            self._hook_thread_id = None
             
             # Clear references to help garbage collection
             self.previous_window_info = None
@@ -1,9 +1,9 @@
 # config.py
+import copy
 import os
 import sys
-from pathlib import Path
-import json
 from logger import Logger
+from utils import FileUtils, IO_BUFFER_SIZE
 from version import VERSION, VERSION_DATE
 
 class Config:
@@ -37,21 +37,26 @@ class Config:
     }
     
     def __new__(cls):
-        """Create or return the singleton instance"""
-        if cls._instance is None:
-            cls._instance = super(Config, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+        """Create or return the singleton instance
+        
+        All setup happens here on first use, so later Config() calls only
+        return the instance.
+        """
+        instance = cls._instance
+        if instance is None:
+            instance = super(Config, cls).__new__(cls)
+            instance._setup()
+            cls._instance = instance
+        return instance
 
-    def __init__(self):
+    def _setup(self):
         """Initialize configuration (only once)"""
-        # Skip initialization if already done
-        if hasattr(self, '_initialized') and self._initialized:
-            return
-            
         # Initialize logger first to ensure it's available
         self.logger = Logger()
         
+        # Change callbacks registered through subscribe(), keyed by setting name
+        self._subscribers = {}
+        
         # Get the base directory of the application using the logger's base_dir
         # This ensures we use the same base directory logic across the application
         base_dir = self.logger.get_base_dir()
@@ -63,27 +68,56 @@ class Config:
         self.load_config()
         
         # Log settings once at INFO level after initial load
-        self.logger.info(f"Loaded settings: dark_mode={self.config.get('dark_mode')}, max_programs={self.config.get('max_programs')}")
-        
-        # Mark as initialized
-        self._initialized = True
+        self.logger.info("Loaded settings: dark_mode=%s, max_programs=%s", self.config.get('dark_mode'), self.config.get('max_programs'))
 
     def load_config(self):
         """Load configuration from file or create default"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    # Merge loaded config with defaults
-                    self.config = {**self.DEFAULT_CONFIG, **loaded_config}
-                    self.logger.debug(f"Loaded settings from file: {self.config_file}")
+                # Fill in defaults missing from the file
+                self.config = self._apply_defaults(FileUtils.read_json(self.config_file))
+                self.logger.debug("Loaded settings from file: %s", self.config_file)
             else:
-                self.config = self.DEFAULT_CONFIG.copy()
+                self.config = copy.deepcopy(self.DEFAULT_CONFIG)
                 self.logger.info("Config file not found, using defaults")
                 self.save_config()
         except Exception as e:
-            self.logger.error(f"Error loading config: {e}")
-            self.config = self.DEFAULT_CONFIG.copy()
+            self.logger.error("Error loading config: %s", e)
+            self.config = copy.deepcopy(self.DEFAULT_CONFIG)
+        self._refresh_cached_attrs()
+
+    def _apply_defaults(self, loaded_config):
+        """Add missing default keys to loaded_config in place and return it.
+        
+        Nested dicts such as window_size get their missing sub-keys too.
+        Defaults are copied, so editing the config never changes DEFAULT_CONFIG.
+        """
+        for key, default in self.DEFAULT_CONFIG.items():
+            value = loaded_config.get(key)
+            if key not in loaded_config:
+                loaded_config[key] = copy.deepcopy(default)
+            elif isinstance(default, dict) and isinstance(value, dict):
+                for sub_key, sub_default in default.items():
+                    value.setdefault(sub_key, sub_default)
+        return loaded_config
+
+    def _refresh_cached_attrs(self):
+        """Mirror frequently read settings into attributes, called whenever config changes"""
+        config = self.config
+        self.max_programs = config.get('max_programs')
+        self.save_interval = config.get('save_interval') or 60  # Default to 60 seconds if None
+        # Built on demand by get_media_programs
+        self._media_programs_set = None
+
+    def get_media_programs(self):
+        """Return the configured media programs as a frozenset for membership checks.
+        
+        The stored setting stays a list for JSON; the set is rebuilt after it changes.
+        """
+        programs = self._media_programs_set
+        if programs is None:
+            programs = self._media_programs_set = frozenset(self.config.get('media_programs') or ())
+        return programs
 
     def save_config(self):
         """Save current configuration to file"""
@@ -91,46 +125,65 @@ class Config:
             # Make sure the directory exists
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             
-            # Create a temporary file first, then move it to avoid corruption
-            temp_file = self.config_file.with_suffix('.tmp')
-            
-            # Write to the temporary file
-            with open(temp_file, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            # Write through a temp file and replace, so a crash can't leave a partial config
+            FileUtils.write_json_atomic(self.config_file, self.config, indent=4)
             
-            # If we got here, the write was successful, so move the temp file to the actual config file
-            if temp_file.exists():
-                # On Windows, we need to remove the destination file first
-                if self.config_file.exists():
-                    self.config_file.unlink()
-                temp_file.rename(self.config_file)
-                
-                # Log success
-                self.logger.info(f"Configuration saved to {self.config_file}")
+            # Log success
+            self.logger.info("Configuration saved to %s", self.config_file)
                 
         except Exception as e:
-            self.logger.error(f"Error saving config: {e}")
+            self.logger.error("Error saving config: %s", e)
 
     def get(self, key, default=None):
         """Get configuration value"""
         return self.config.get(key, default)
 
     def set(self, key, value):
-        """Set configuration value and save"""
+        """Set configuration value and save, doing nothing if it is unchanged"""
+        if key in self.config and self.config[key] == value:
+            return
         old_value = self.config.get(key)
         self.config[key] = value
-        self.logger.info(f"Config changed: {key} {old_value} -> {value}")
+        self._refresh_cached_attrs()
+        self.logger.info("Config changed: %s %s -> %s", key, old_value, value)
         
         # Save immediately after any setting change
         self.save_config()
+        self._notify(key, value)
 
     def update(self, updates):
-        """Update multiple configuration values"""
+        """Update multiple configuration values, skipping unchanged ones"""
+        updates = {k: v for k, v in updates.items() if k not in self.config or self.config[k] != v}
+        if not updates:
+            return
         for k, v in updates.items():
             old_v = self.config.get(k)
-            self.logger.info(f"Config updated: {k} {old_v} -> {v}")
+            self.logger.info("Config updated: %s %s -> %s", k, old_v, v)
             self.config[k] = v
+        self._refresh_cached_attrs()
         self.save_config()
+        for k, v in updates.items():
+            self._notify(k, v)
+
+    def subscribe(self, key, callback):
+        """Register a callback to run whenever a configuration value changes.
+
+        Parameters
+        ----------
+        key : str
+            Configuration key to watch.
+        callback : callable
+            Called with the new value after it has been stored.
+        """
+        self._subscribers.setdefault(key, []).append(callback)
+
+    def _notify(self, key, value):
+        """Call the callbacks subscribed to key with its new value"""
+        for callback in self._subscribers.get(key, ()):
+            try:
+                callback(value)
+            except Exception as e:
+                self.logger.error("Error in config callback for %s: %s", key, Logger.format_error(e))
 
     def export_config(self, filepath):
         """Export current configuration to a JSON file.
@@ -145,12 +198,12 @@ class Config:
             True on success, False on failure.
         """
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
-            self.logger.info(f"Exported config to {filepath}")
+            with open(filepath, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                f.write(FileUtils.dumps_json(self.config, indent=2))
+            self.logger.info("Exported config to %s", filepath)
             return True
         except Exception as e:
-            self.logger.error(f"Error exporting config: {Logger.format_error(e)}")
+            self.logger.error("Error exporting config: %s", Logger.format_error(e))
             return False
 
     def import_config(self, filepath):
@@ -166,12 +219,11 @@ class Config:
             True on success, False on failure.
         """
         try:
-            if not Path(filepath).exists():
-                self.logger.error(f"Import path does not exist: {filepath}")
+            if not os.path.exists(filepath):
+                self.logger.error("Import path does not exist: %s", filepath)
                 return False
 
-            with open(filepath, 'r', encoding='utf-8') as f:
-                loaded_config = json.load(f)
+            loaded_config = FileUtils.read_json(filepath)
 
             if not isinstance(loaded_config, dict):
                 self.logger.error("Imported config has unexpected format.")
@@ -179,11 +231,14 @@ class Config:
 
             # Merge loaded config with current config, prioritizing loaded values
             self.config = {**self.config, **loaded_config}
+            self._refresh_cached_attrs()
             self.save_config()
-            self.logger.info(f"Imported config from {filepath}")
+            for k, v in loaded_config.items():
+                self._notify(k, v)
+            self.logger.info("Imported config from %s", filepath)
             return True
         except Exception as e:
-            self.logger.error(f"Error importing config: {Logger.format_error(e)}")
+            self.logger.error("Error importing config: %s", Logger.format_error(e))
             return False
 
     def get_version(self):
@@ -1,43 +1,163 @@
 # data_manager.py
-import json
 import csv
 import os
 import time
+import threading
+import queue
+from collections import defaultdict
+from collections.abc import Mapping
 from pathlib import Path
 from logger import Logger
 from config import Config # Import Config
+from utils import FileUtils, IO_BUFFER_SIZE, MSGPACK_AVAILABLE
+
+# Seconds the writer waits after a save request so a burst of edits is written once
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+# Queued to make the writer thread save one last time and exit
+_STOP_WRITER = object()
+
+class _LiveTimesView(Mapping):
+    """Read-only view of tracked times with the running session added.
+    
+    Reads go through to the tracked_programs dict, so building the view
+    doesn't copy it. Use dict(view) for a snapshot.
+    """
+    __slots__ = ('_base', '_current', '_elapsed')
+    
+    def __init__(self, base, current, elapsed):
+        self._base = base
+        self._current = current
+        self._elapsed = elapsed
+        
+    def __getitem__(self, program):
+        # get() rather than [], tracked_programs is a defaultdict and must not grow on reads
+        value = self._base.get(program)
+        if program == self._current:
+            return (value or 0.0) + self._elapsed
+        if value is None:
+            raise KeyError(program)
+        return value
+        
+    def __contains__(self, program):
+        return program in self._base or (self._current is not None and program == self._current)
+        
+    def _keys(self):
+        # Snapshot, import_data(merge=True) can add keys from the worker thread mid-iteration
+        keys = list(self._base)
+        if self._current is not None and self._current not in self._base:
+            keys.append(self._current)
+        return keys
+        
+    def __iter__(self):
+        return iter(self._keys())
+        
+    def __len__(self):
+        if self._current is not None and self._current not in self._base:
+            return len(self._base) + 1
+        return len(self._base)
+        
+    def items(self):
+        if self._current is None:
+            return list(self._base.items())
+        return super().items()
+        
+    def values(self):
+        if self._current is None:
+            return list(self._base.values())
+        return super().values()
 
 class DataManager:
     """Manages program data persistence and tracking"""
     def __init__(self, config: Config): # Accept config object
-        self.tracked_programs = {}
+        # Seconds per program; missing programs read as 0.0 so updates are a single d[k] += x
+        self.tracked_programs = defaultdict(float)
         self.display_names = {}  # Store custom display names
         self.currently_tracking = None
         self.start_time = None
         self.logger = Logger()
         self.config = config # Store config object
-        self.max_programs = self.config.get('max_programs') # Get max_programs from config
+        # Bytes of the last successful save, used to skip identical saves
+        self._last_saved_payload = None
+        # Set by load_data when the newest data file is msgpack but msgpack isn't installed
+        self._saves_blocked = False
+        # Saves are requested through this queue and written by a single writer thread
+        self._save_queue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._writer_loop, name="DataWriter", daemon=True)
+        self._writer.start()
+        self.max_programs = self.config.max_programs # Get max_programs from config
         self.data_file_path = self.logger.get_base_dir() / 'program_tracker_data.json'
+        # Compact binary copy written instead of the JSON file when msgpack is installed
+        self.msgpack_file_path = self.data_file_path.with_suffix('.msgpack')
         self.load_data()
         
         # After loading data, only update max_programs if tracked programs exceed the limit
         num_tracked_programs = len(self.tracked_programs)
         max_programs_val = self.max_programs or 0  # Handle None case
         if num_tracked_programs > max_programs_val:
-            self.logger.info(f"Loaded {num_tracked_programs} programs, which exceeds current max limit of {self.max_programs}. Updating max_programs setting.")
+            self.logger.info("Loaded %d programs, which exceeds current max limit of %s. Updating max_programs setting.", num_tracked_programs, self.max_programs)
             self.config.set('max_programs', num_tracked_programs)
             self.max_programs = num_tracked_programs
         
     def save_data(self):
-        """Save tracked program data to file"""
+        """Save tracked program data to file.
+        
+        Writes the msgpack file when msgpack is installed, otherwise the JSON file.
+        The other file is left alone; load_data reads whichever is newer.
+        Does nothing while load_data has blocked saves.
+        """
+        if self._saves_blocked:
+            return
         try:
-            with open(self.data_file_path, 'w') as f:
-                json.dump({
-                    'tracked_programs': self.tracked_programs,
-                    'display_names': self.display_names
-                }, f)
+            data = {
+                'tracked_programs': self.tracked_programs,
+                'display_names': self.display_names
+            }
+            if MSGPACK_AVAILABLE:
+                path, payload = self.msgpack_file_path, FileUtils.dumps_msgpack(data)
+            else:
+                path, payload = self.data_file_path, FileUtils.dumps_json(data)
+            # Nothing changed since the last save, skip the write and fsync
+            if payload == self._last_saved_payload:
+                return
+            FileUtils.write_bytes_atomic(path, payload)
+            self._last_saved_payload = payload
         except Exception as e:
-            self.logger.error(f"Error saving data: {Logger.format_error(e)}")
+            self.logger.error("Error saving data: %s", Logger.format_error(e))
+            
+    def request_save(self):
+        """Ask the writer thread to save; returns immediately.
+        
+        Requests made within SAVE_DEBOUNCE_SECONDS of each other are written once.
+        """
+        self._save_queue.put(None)
+        
+    def _writer_loop(self):
+        """Writer thread: wait for save requests, coalesce bursts, write once"""
+        save_queue = self._save_queue
+        while True:
+            stop = save_queue.get() is _STOP_WRITER
+            # Collect further requests for a short window so a burst of edits is one write
+            deadline = time.monotonic() + SAVE_DEBOUNCE_SECONDS
+            while not stop:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    stop = save_queue.get(timeout=remaining) is _STOP_WRITER
+                except queue.Empty:
+                    break
+            self.save_data()
+            if stop:
+                return
+                
+    def flush(self):
+        """Write pending changes and stop the writer thread (used on shutdown)"""
+        self._save_queue.put(_STOP_WRITER)
+        self._writer.join(timeout=5.0)
+        if self._writer.is_alive():
+            # Writer is stuck, save from this thread so nothing is lost
+            self.save_data()
             
     def export_data(self, filepath):
         """Export tracked program data to a JSON or CSV file.
@@ -52,23 +172,25 @@ class DataManager:
             ``True`` on success, ``False`` on failure.
         """
         try:
-            if filepath.lower().endswith('.csv'):
-                with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            if os.path.splitext(filepath)[1].lower() == '.csv':
+                with open(filepath, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
                     writer = csv.writer(f)
                     writer.writerow(['program', 'seconds', 'display_name'])
-                    for program, seconds in self.tracked_programs.items():
-                        display_name = self.display_names.get(program, '')
-                        writer.writerow([program, seconds, display_name])
+                    display_name_get = self.display_names.get
+                    writer.writerows(
+                        (program, seconds, display_name_get(program, ''))
+                        for program, seconds in self.tracked_programs.items()
+                    )
             else:  # default to JSON
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump({
+                with open(filepath, 'wb', buffering=IO_BUFFER_SIZE) as f:
+                    f.write(FileUtils.dumps_json({
                         'tracked_programs': self.tracked_programs,
                         'display_names': self.display_names
-                    }, f, indent=2)
-            self.logger.info(f"Exported data to {filepath}")
+                    }, indent=2))
+            self.logger.info("Exported data to %s", filepath)
             return True
         except Exception as e:
-            self.logger.error(f"Error exporting data: {Logger.format_error(e)}")
+            self.logger.error("Error exporting data: %s", Logger.format_error(e))
             return False
 
     def import_data(self, filepath, merge=False):
@@ -87,34 +209,39 @@ class DataManager:
         """
         try:
             # Ensure self.max_programs is up-to-date with the current config value
-            self.max_programs = self.config.get('max_programs')
+            self.max_programs = self.config.max_programs
 
             loaded_programs = {}
             loaded_display_names = {}
             if not os.path.exists(filepath):
-                self.logger.error(f"Import path does not exist: {filepath}")
+                self.logger.error("Import path does not exist: %s", filepath)
                 return False
 
-            if filepath.lower().endswith('.csv'):
-                with open(filepath, 'r', newline='', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
+            if os.path.splitext(filepath)[1].lower() == '.csv':
+                with open(filepath, 'r', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as f:
+                    reader = csv.reader(f)
+                    # Resolve column positions once, header names are case-insensitive
+                    header = [name.strip().lower() for name in next(reader, [])]
+                    program_idx = header.index('program')
+                    seconds_idx = header.index('seconds')
+                    name_idx = header.index('display_name') if 'display_name' in header else -1
                     for row in reader:
-                        program = row.get('program') or row.get('Program')
-                        seconds = float(row.get('seconds') or row.get('Seconds') or 0)
-                        display_name = row.get('display_name') or row.get('Display_name') or ''
-                        loaded_programs[program] = seconds
-                        if display_name:
-                            loaded_display_names[program] = display_name
+                        if len(row) <= program_idx:
+                            continue  # Blank or truncated line
+                        program = row[program_idx]
+                        seconds = row[seconds_idx] if seconds_idx < len(row) else ''
+                        loaded_programs[program] = float(seconds or 0)
+                        if 0 <= name_idx < len(row) and row[name_idx]:
+                            loaded_display_names[program] = row[name_idx]
             else:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Support both legacy and new formats
-                    if 'tracked_programs' in data:
-                        loaded_programs = data.get('tracked_programs', {})
-                        loaded_display_names = data.get('display_names', {})
-                    else:
-                        loaded_programs = data
-                        loaded_display_names = {}
+                data = FileUtils.read_json(filepath)
+                # Support both legacy and new formats
+                if 'tracked_programs' in data:
+                    loaded_programs = data.get('tracked_programs', {})
+                    loaded_display_names = data.get('display_names', {})
+                else:
+                    loaded_programs = data
+                    loaded_display_names = {}
 
             if not isinstance(loaded_programs, dict):
                 self.logger.error("Imported data has unexpected format.")
@@ -128,12 +255,13 @@ class DataManager:
                 # If merging would exceed max_programs, update the setting
                 max_programs_val = self.max_programs or 0  # Handle None case
                 if potential_new_size > max_programs_val:
-                    self.logger.info(f"Merging data would result in {potential_new_size} programs, which exceeds the current max limit of {self.max_programs}. Updating max_programs setting.")
+                    self.logger.info("Merging data would result in %d programs, which exceeds the current max limit of %s. Updating max_programs setting.", potential_new_size, self.max_programs)
                     self.config.set('max_programs', potential_new_size)
                     self.max_programs = potential_new_size # Update local attribute as well
 
+                tracked = self.tracked_programs
                 for program, seconds in loaded_programs.items():
-                    self.tracked_programs[program] = self.tracked_programs.get(program, 0) + seconds
+                    tracked[program] += seconds
                 
                 # Merge display names, keeping existing ones if there's a conflict
                 for program, name in loaded_display_names.items():
@@ -143,83 +271,122 @@ class DataManager:
                 # If replacing, update max_programs if imported data has more programs
                 max_programs_val = self.max_programs or 0  # Handle None case
                 if len(loaded_programs) > max_programs_val:
-                    self.logger.info(f"Imported data contains {len(loaded_programs)} programs, which exceeds the current max limit of {self.max_programs}. Updating max_programs setting.")
+                    self.logger.info("Imported data contains %d programs, which exceeds the current max limit of %s. Updating max_programs setting.", len(loaded_programs), self.max_programs)
                     self.config.set('max_programs', len(loaded_programs))
                     self.max_programs = len(loaded_programs) # Update local attribute as well
-                self.tracked_programs = loaded_programs
+                self.tracked_programs = defaultdict(float, loaded_programs)
                 self.display_names = loaded_display_names
 
-            self.save_data()
-            self.logger.info(f"Imported data from {filepath}")
+            self.request_save()
+            self.logger.info("Imported data from %s", filepath)
             return True
         except Exception as e:
-            self.logger.error(f"Error importing data: {Logger.format_error(e)}")
+            self.logger.error("Error importing data: %s", Logger.format_error(e))
             return False
 
+    def _read_data_file(self, path):
+        """Decode the msgpack or JSON data file at path"""
+        if path == self.msgpack_file_path:
+            if not MSGPACK_AVAILABLE:
+                raise RuntimeError("msgpack is not installed")
+            return FileUtils.read_msgpack(path)
+        return FileUtils.read_json(path)
+
     def load_data(self):
-        """Load tracked program data from file"""
+        """Load tracked program data from the newer of the msgpack and JSON files.
+        
+        If the newer file can't be decoded the error is logged and the older
+        one is used; neither file is removed. If the newer file is msgpack and
+        msgpack isn't installed, saving is blocked for the session so the JSON
+        file doesn't become the newer one and hide the msgpack data.
+        """
         try:
-            if self.data_file_path.exists():
-                with open(self.data_file_path, 'r') as f:
-                    data = json.load(f)
-                    self.tracked_programs = data.get('tracked_programs', {})
-                    self.display_names = data.get('display_names', {})
+            data = None
+            candidates = []
+            for path in (self.msgpack_file_path, self.data_file_path):
+                try:
+                    candidates.append((path.stat().st_mtime, path))
+                except FileNotFoundError:
+                    pass
+            # Newest first
+            candidates.sort(key=lambda item: item[0], reverse=True)
+            if candidates and candidates[0][1] == self.msgpack_file_path and not MSGPACK_AVAILABLE:
+                self._saves_blocked = True
+                self.logger.error("%s is newer than the JSON data file but msgpack is not installed. "
+                                  "Changes made this session won't be saved; install msgpack to load it.",
+                                  self.msgpack_file_path)
+            for index, (_, path) in enumerate(candidates):
+                try:
+                    data = self._read_data_file(path)
+                    break
+                except Exception as e:
+                    if index + 1 == len(candidates):
+                        raise
+                    self.logger.error("Error reading newer data file %s, loading %s instead: %s",
+                                      path, candidates[index + 1][1], e)
+            if data is not None:
+                self.tracked_programs = defaultdict(float, data.get('tracked_programs', {}))
+                self.display_names = data.get('display_names', {})
             else:
-                self.tracked_programs = {}
+                self.tracked_programs = defaultdict(float)
                 self.display_names = {}
         except Exception as e:
-            self.logger.error(f"Error loading data: {Logger.format_error(e)}")
-            self.tracked_programs = {}
+            self.logger.error("Error loading data: %s", Logger.format_error(e))
+            self.tracked_programs = defaultdict(float)
             self.display_names = {}
             
     def update_tracking(self, program, is_active):
         """Update tracking for specified program"""
+        now = time.monotonic()
         if program != self.currently_tracking:
             if self.currently_tracking and self.start_time is not None:
-                self._update_elapsed_time() # Changed from _save_elapsed_time
+                self._update_elapsed_time(now)
             
             self.currently_tracking = program
-            self.start_time = time.time() if is_active else None
+            self.start_time = now if is_active else None
             
         elif self.start_time is not None and is_active:
-            self._update_elapsed_time() # Changed from _save_elapsed_time
-            self.start_time = time.time()
+            self._update_elapsed_time(now)
             
-    def _update_elapsed_time(self): # Renamed from _save_elapsed_time
-        """Update elapsed time for current program"""
-        if self.currently_tracking and self.start_time is not None:
-            elapsed = time.time() - self.start_time
-            self.tracked_programs[self.currently_tracking] = self.tracked_programs.get(self.currently_tracking, 0) + elapsed # Ensure program exists
-            # self.save_data() # Removed save_data call
+    def _update_elapsed_time(self, now=None):
+        """Add the time since start_time to the current program and restart the interval
+        
+        start_time is a time.monotonic() value, so wall clock changes can't
+        produce negative or inflated intervals.
+        """
+        current, start = self.currently_tracking, self.start_time
+        if current and start is not None:
+            if now is None:
+                now = time.monotonic()
+            self.tracked_programs[current] += now - start
+            self.start_time = now
             
     def get_current_times(self):
-        """Get current times for all programs including active session"""
-        current_times = self.tracked_programs.copy()
+        """Get current times for all programs including active session
         
-        if (self.currently_tracking and 
-            self.start_time is not None):
-            elapsed = time.time() - self.start_time
-            current_times[self.currently_tracking] = current_times.get(
-                self.currently_tracking, 0) + elapsed
-                
-        return current_times
+        Returns a read-only mapping over tracked_programs instead of a copy.
+        """
+        current, start = self.currently_tracking, self.start_time
+        if current and start is not None:
+            return _LiveTimesView(self.tracked_programs, current, time.monotonic() - start)
+        return _LiveTimesView(self.tracked_programs, None, 0.0)
         
     def reset_program(self, program):
         """Reset timer for specified program"""
         if program in self.tracked_programs:
             self.tracked_programs[program] = 0
             if self.currently_tracking == program:
-                self.start_time = time.time()
-            self.save_data() # Keep save here as it's a direct user action
-            self.logger.info(f"Timer reset for {program}")
+                self.start_time = time.monotonic()
+            self.request_save() # Direct user action, saved after a short debounce
+            self.logger.info("Timer reset for %s", program)
             
     def reset_all_programs(self):
         """Reset timers for all programs"""
         for program in self.tracked_programs:
             self.tracked_programs[program] = 0
         if self.currently_tracking:
-            self.start_time = time.time()
-        self.save_data() # Keep save here as it's a direct user action
+            self.start_time = time.monotonic()
+        self.request_save() # Direct user action, saved after a short debounce
         self.logger.info("All timers reset")
             
     def remove_program(self, program):
@@ -231,28 +398,31 @@ class DataManager:
             del self.tracked_programs[program]
             if program in self.display_names:
                 del self.display_names[program]
-            self.save_data() # Keep save here as it's a direct user action
-            self.logger.info(f"Stopped tracking {program}")
+            self.request_save() # Direct user action, saved after a short debounce
+            self.logger.info("Stopped tracking %s", program)
             
     def remove_all_programs(self):
         """Remove all programs from tracking"""
-        self.tracked_programs = {}
+        self.tracked_programs = defaultdict(float)
         self.display_names = {}
         self.currently_tracking = None
         self.start_time = None
-        self.save_data()
+        self.request_save()
         self.logger.info("Removed all tracked programs")
         
     def set_display_name(self, program, display_name):
         """Set a custom display name for a program"""
         if program in self.tracked_programs:
-            if display_name and display_name.strip():
-                self.display_names[program] = display_name.strip()
-            elif program in self.display_names:
+            display_name = display_name.strip() if display_name else ''
+            if display_name == self.display_names.get(program, ''):
+                return True  # Unchanged, nothing to save
+            if display_name:
+                self.display_names[program] = display_name
+            else:
                 # If empty name provided, remove custom name
                 del self.display_names[program]
-            self.save_data()
-            self.logger.info(f"Updated display name for {program}: {display_name}")
+            self.request_save()
+            self.logger.info("Updated display name for %s: %s", program, display_name)
             return True
         return False
         
@@ -1,14 +1,17 @@
 import sys
 import subprocess
-import pkg_resources
+import importlib
+import importlib.util
+import re
 import os
-import time
 from tkinter import Tk, Label, ttk, messagebox
 import threading
-import site
+import sysconfig
+import json
 import shutil
 import logging
-import traceback
+
+from logger import _app_base_dir
 
 # Set up logging
 logging.basicConfig(
@@ -17,18 +20,64 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+def _normalize_name(name):
+    """Normalize a distribution name for comparison (PEP 503)"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def get_installed_packages():
+    """Return the normalized names of all installed distributions, from one sys.path scan"""
+    # Imported here so a cached dependency check never loads importlib.metadata
+    from importlib.metadata import distributions
+    installed = set()
+    for dist in distributions():
+        name = dist.metadata['Name']
+        if name:
+            installed.add(_normalize_name(name))
+    return installed
+
 REQUIRED_PACKAGES = {
     'pywin32': 'pywin32',
     'psutil': 'psutil',
     'tkinter': None  # Built into Python
 }
 
+# Written after a successful check, skips the scan while site-packages is unchanged
+DEPS_CACHE_FILE = _app_base_dir() / "logs" / ".deps_ok"
+
+def _site_packages_mtime():
+    """Return the latest mtime of site-packages and its *.dist-info directories"""
+    purelib = sysconfig.get_paths()['purelib']
+    latest = os.path.getmtime(purelib)
+    with os.scandir(purelib) as entries:
+        for entry in entries:
+            if entry.name.endswith('.dist-info'):
+                latest = max(latest, entry.stat().st_mtime)
+    return latest
+
+def _deps_cache_valid():
+    """Return True if the last successful check still applies"""
+    try:
+        with open(DEPS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        return (cached.get('site_mtime') == _site_packages_mtime()
+                and cached.get('packages') == sorted(REQUIRED_PACKAGES))
+    except (OSError, ValueError, AttributeError):
+        return False
+
+def _write_deps_cache():
+    """Record that all required packages are installed"""
+    try:
+        DEPS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(DEPS_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({'site_mtime': _site_packages_mtime(), 'packages': sorted(REQUIRED_PACKAGES)}, f)
+    except OSError as e:
+        logging.warning("Could not write dependency cache: %s", e)
+
 class InstallerGUI:
     def __init__(self):
         try:
             self.root = Tk()
             self.root.title("TokiKanri Installer")
-            self.root.geometry("400x200")
             self.root.configure(bg="#ffffff")
             
             # Prevent window from being closed during installation
@@ -68,7 +117,7 @@ class InstallerGUI:
             
             logging.info("GUI initialized successfully")
         except Exception as e:
-            logging.error(f"Error initializing GUI: {str(e)}\n{traceback.format_exc()}")
+            logging.error("Error initializing GUI: %s", e, exc_info=True)
             raise
 
     def center_window(self):
@@ -81,13 +130,27 @@ class InstallerGUI:
         self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
 
     def update_status(self, message, progress_value):
+        """Queue a status update; safe to call from the worker thread"""
         try:
-            self.status_label.config(text=message)
-            self.progress['value'] = progress_value
-            self.root.update()
-            logging.info(f"Status updated: {message} - Progress: {progress_value}")
+            # The main thread applies it from mainloop, so the worker never touches widgets
+            self.root.after(0, self._apply_status, message, progress_value)
+            logging.info("Status updated: %s - Progress: %s", message, progress_value)
         except Exception as e:
-            logging.error(f"Error updating status: {str(e)}\n{traceback.format_exc()}")
+            logging.error("Error updating status: %s", e, exc_info=True)
+
+    def _apply_status(self, message, progress_value):
+        self.status_label.config(text=message)
+        self.progress['value'] = progress_value
+
+    def close(self):
+        """Close the window from the worker thread after queued updates have run"""
+        closed = threading.Event()
+        def destroy():
+            self.installation_complete = True
+            self.root.destroy()
+            closed.set()
+        self.root.after(0, destroy)
+        closed.wait()
 
     def on_closing(self):
         if self.installation_complete:
@@ -102,57 +165,63 @@ def post_pywin32_install():
         python_path = sys.executable
         python_dir = os.path.dirname(python_path)
         
+        # Current pywin32 wheels set themselves up; only run the script if the modules can't be found
+        importlib.invalidate_caches()
+        if importlib.util.find_spec('win32api') and importlib.util.find_spec('pythoncom'):
+            logging.info("pywin32 modules found, skipping post-install script")
+            return
+        
         logging.info("Running pywin32 post-install script")
-        subprocess.run([python_path, os.path.join(site.getsitepackages()[0], 'pywin32_postinstall.py'), '-install'])
+        subprocess.run([python_path, os.path.join(sysconfig.get_paths()['purelib'], 'pywin32_postinstall.py'), '-install'])
         logging.info("pywin32 post-install completed successfully")
     except Exception as e:
-        logging.error(f"Error in pywin32 post-install: {str(e)}\n{traceback.format_exc()}")
+        logging.error("Error in pywin32 post-install: %s", e, exc_info=True)
         messagebox.showerror("Error", f"Error during pywin32 installation: {str(e)}")
 
 def check_and_install_dependencies(gui):
     try:
-        missing_packages = []
+        if _deps_cache_valid():
+            logging.info("Requirements unchanged since last check, skipping package scan")
+        else:
+            missing_packages = []
+            installed = get_installed_packages()
         
-        # Check for required packages
-        for package, pip_name in REQUIRED_PACKAGES.items():
-            if pip_name:  # Skip tkinter as it's built into Python
-                try:
-                    pkg_resources.get_distribution(package)
-                    gui.update_status(f"✓ {package} is installed", 30)
-                    logging.info(f"Package {package} is already installed")
-                    time.sleep(0.5)
-                except pkg_resources.DistributionNotFound:
-                    missing_packages.append(pip_name)
-                    gui.update_status(f"✗ {package} is missing", 30)
-                    logging.info(f"Package {package} needs to be installed")
-                    time.sleep(0.5)
+            # Check for required packages
+            for package, pip_name in REQUIRED_PACKAGES.items():
+                if pip_name:  # Skip tkinter as it's built into Python
+                    if _normalize_name(package) in installed:
+                        gui.update_status(f"✓ {package} is installed", 30)
+                        logging.info("Package %s is already installed", package)
+                    else:
+                        missing_packages.append(pip_name)
+                        gui.update_status(f"✗ {package} is missing", 30)
+                        logging.info("Package %s needs to be installed", package)
         
-        # Install missing packages
-        if missing_packages:
-            gui.update_status("Installing missing packages...", 50)
-            for package in missing_packages:
+            # Install missing packages
+            if missing_packages:
+                gui.update_status("Installing missing packages...", 50)
+                # One pip run for everything, so pip starts up and resolves only once.
+                # pip has no supported in-process API, so it stays a subprocess; skip its self-update check.
                 try:
-                    subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-                    if package == 'pywin32':
-                        post_pywin32_install()
-                    gui.update_status(f"✓ Installed {package}", 70)
-                    logging.info(f"Successfully installed {package}")
-                    time.sleep(0.5)
+                    subprocess.check_call([sys.executable, "-m", "pip", "install", "--disable-pip-version-check", *missing_packages])
                 except subprocess.CalledProcessError as e:
-                    error_msg = f"Error installing {package}: {str(e)}"
-                    logging.error(f"{error_msg}\n{traceback.format_exc()}")
+                    error_msg = f"Error installing {', '.join(missing_packages)}: {str(e)}"
+                    logging.error(error_msg, exc_info=True)
                     messagebox.showerror("Installation Error", error_msg)
                     sys.exit(1)
+                if 'pywin32' in missing_packages:
+                    post_pywin32_install()
+                gui.update_status(f"✓ Installed {', '.join(missing_packages)}", 70)
+                logging.info("Successfully installed %s", ', '.join(missing_packages))
+        
+            _write_deps_cache()
         
         gui.update_status("All requirements satisfied!", 90)
-        time.sleep(1)
         
         # Run the main program
         try:
             gui.update_status("Starting TokiKanri...", 100)
-            time.sleep(1)
-            gui.installation_complete = True
-            gui.root.destroy()
+            gui.close()
             
             logging.info("Starting main program")
             # Import and run the main program
@@ -162,13 +231,13 @@ def check_and_install_dependencies(gui):
             
         except Exception as e:
             error_msg = f"Error starting the program: {str(e)}"
-            logging.error(f"{error_msg}\n{traceback.format_exc()}")
+            logging.error(error_msg, exc_info=True)
             messagebox.showerror("Error", error_msg)
             sys.exit(1)
             
     except Exception as e:
         error_msg = f"Error during dependency check: {str(e)}"
-        logging.error(f"{error_msg}\n{traceback.format_exc()}")
+        logging.error(error_msg, exc_info=True)
         messagebox.showerror("Error", error_msg)
         sys.exit(1)
 
@@ -187,7 +256,7 @@ def main():
         
     except Exception as e:
         error_msg = f"Error in installer: {str(e)}"
-        logging.error(f"{error_msg}\n{traceback.format_exc()}")
+        logging.error(error_msg, exc_info=True)
         messagebox.showerror("Error", error_msg)
         sys.exit(1)
 
@@ -195,5 +264,5 @@ if __name__ == "__main__":
     try:
         main()
     except Exception as e:
-        logging.error(f"Critical error: {str(e)}\n{traceback.format_exc()}")
+        logging.error("Critical error: %s", e, exc_info=True)
         messagebox.showerror("Critical Error", f"A critical error occurred: {str(e)}\nCheck tokikanri_log.txt for details.")
\ No newline at end of file
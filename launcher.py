@@ -2,8 +2,7 @@
 import os
 import sys
 import traceback
-import tkinter as tk
-import time
+import importlib.util
 from logger import Logger
 
 # Initialize logger
@@ -27,10 +26,9 @@ def check_required_modules():
     ]
     missing_modules = []
     
+    # find_spec only locates each module, it doesn't run its import-time code
     for module in required_modules:
-        try:
-            __import__(module)
-        except ImportError:
+        if importlib.util.find_spec(module) is None:
             missing_modules.append(module)
     
     if missing_modules:
@@ -90,9 +88,10 @@ Please report this error to the developer."""
 class ErrorWindow:
     """Error display window"""
     def __init__(self):
+        # tkinter is only needed when an error has to be shown
+        import tkinter as tk
         self.root = tk.Tk()
         self.root.title("TokiKanri Error")
-        self.root.geometry("600x400")
         self.root.configure(bg='white')
         
         # Center window
@@ -121,7 +120,10 @@ class ErrorWindow:
     
     def show_error(self, error_message):
         """Display error message"""
+        # Insert unwrapped so the text is laid out once, then make it read-only
+        self.text.configure(state='normal', wrap='none')
         self.text.insert('1.0', error_message)
+        self.text.configure(wrap='word', state='disabled')
         self.root.mainloop()
 
 if __name__ == "__main__":
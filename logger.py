@@ -6,6 +6,19 @@ from logging.handlers import RotatingFileHandler
 import sys
 import time
 import codecs
+import functools
+
+@functools.lru_cache(maxsize=1)
+def _app_base_dir():
+    """Return the application base directory, computed once per process"""
+    if getattr(sys, 'frozen', False):
+        # If the application is bundled by PyInstaller
+        return Path(sys.executable).parent
+    # If running as a script
+    return Path(os.path.abspath(os.path.dirname(__file__)))
+
+# Names of loggers whose handlers are already set up in this process
+_configured = set()
 
 class Logger:
     """Application logging management"""
@@ -13,14 +26,12 @@ class Logger:
         self.logger = logging.getLogger(name)
         
         # Determine the base directory of the application
-        if getattr(sys, 'frozen', False):
-            # If the application is bundled by PyInstaller
-            self._base_dir = Path(sys.executable).parent
-        else:
-            # If running as a script
-            self._base_dir = Path(os.path.abspath(os.path.dirname(__file__)))
-            
-        self.setup_logger()
+        self._base_dir = _app_base_dir()
+        
+        # Later Logger() calls for the same name reuse the configured logger
+        if name not in _configured:
+            self.setup_logger()
+            _configured.add(name)
 
     def setup_logger(self):
         """Configure logger settings"""
@@ -48,7 +59,8 @@ class Logger:
             log_file,
             maxBytes=5*1024*1024,  # 5MB
             backupCount=3,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True  # Open the file on the first record, not at startup
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(file_formatter)
@@ -62,25 +74,35 @@ class Logger:
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
 
-    def debug(self, message):
-        """Log debug message"""
-        self.logger.debug(message)
-
-    def info(self, message):
-        """Log info message"""
-        self.logger.info(message)
-
-    def warning(self, message):
-        """Log warning message"""
-        self.logger.warning(message)
-
-    def error(self, message, exc_info=True):
+    def is_enabled_for(self, level):
+        """Return whether messages at the given level would be logged"""
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, message, *args):
+        """Log debug message, %-formatted with args only if the level is enabled"""
+        logger = self.logger
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(message, *args)
+
+    def info(self, message, *args):
+        """Log info message, %-formatted with args only if the level is enabled"""
+        logger = self.logger
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(message, *args)
+
+    def warning(self, message, *args):
+        """Log warning message, %-formatted with args only if the level is enabled"""
+        logger = self.logger
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(message, *args)
+
+    def error(self, message, *args, exc_info=True):
         """Log error message"""
-        self.logger.error(message, exc_info=exc_info)
+        self.logger.error(message, *args, exc_info=exc_info)
 
-    def critical(self, message, exc_info=True):
+    def critical(self, message, *args, exc_info=True):
         """Log critical message"""
-        self.logger.critical(message, exc_info=exc_info)
+        self.logger.critical(message, *args, exc_info=exc_info)
 
     @staticmethod
     def format_error(e):
@@ -95,7 +117,7 @@ class Logger:
 
 class UnicodeRotatingFileHandler(RotatingFileHandler):
     """A RotatingFileHandler that ensures UTF-8 encoding"""
-    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding='utf-8', delay=False):
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding='utf-8', delay=True):
         super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
 
 
@@ -105,18 +127,29 @@ class UnicodeStreamHandler(logging.StreamHandler):
         if stream is None:
             stream = sys.stdout
         super().__init__(stream)
+        # None when there is no console (windowed PyInstaller build)
+        self._write = getattr(self.stream, 'write', None)
+        
+    def setStream(self, stream):
+        old = super().setStream(stream)
+        self._write = getattr(self.stream, 'write', None)
+        return old
         
     def emit(self, record):
         try:
+            write = self._write
+            if write is None:
+                return
             msg = self.format(record)
-            stream = self.stream
             # Safely encode and decode for console output
             try:
-                stream.write(msg + self.terminator)
+                write(msg)
             except UnicodeEncodeError:
                 # If console can't handle the encoding, use a safe representation
-                safe_msg = msg.encode('utf-8', errors='replace').decode('utf-8', errors='replace')
-                stream.write(safe_msg + self.terminator)
-            self.flush()
+                write(msg.encode('utf-8', errors='replace').decode('utf-8', errors='replace'))
+            write(self.terminator)
+            # Info lines can sit in the stream buffer, warnings and errors go out at once
+            if record.levelno >= logging.WARNING:
+                self.flush()
         except Exception:
             self.handleError(record)
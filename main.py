@@ -1,13 +1,9 @@
 # main.py
 import sys
 import traceback
-import tkinter as tk
-from tkinter import messagebox
+import importlib.util
 import os
-import time
-from program_tracker import ProgramTokiKanri
 from logger import Logger
-from version import get_version_string
 
 # Constants for ErrorWindow
 ERROR_WINDOW_WIDTH = 600
@@ -29,9 +25,10 @@ logger = Logger()
 class ErrorWindow:
     """Error display window for application errors"""
     def __init__(self):
+        # tkinter is only needed when an error has to be shown
+        import tkinter as tk
         self.root = tk.Tk()
         self.root.title(ERROR_WINDOW_TITLE)
-        self.root.geometry(f"{ERROR_WINDOW_WIDTH}x{ERROR_WINDOW_HEIGHT}")
         self.root.configure(bg=ERROR_WINDOW_BG)
         
         # Center the window
@@ -60,32 +57,30 @@ class ErrorWindow:
     
     def show_error(self, error_message):
         """Display error message and show window"""
+        # Insert unwrapped so the text is laid out once, then make it read-only
+        self.text.configure(state='normal', wrap='none')
         self.text.insert('1.0', error_message)
+        self.text.configure(wrap='word', state='disabled')
         self.root.mainloop()
 
 def check_requirements():
     """Check Python version and required modules"""
-    try:
-        # Check Python version
-        if sys.version_info < MIN_PYTHON_VERSION:
-            return False, f"Python {'.'.join(map(str, MIN_PYTHON_VERSION))} or higher is required"
-        
-        # Check required modules
-        missing_modules = []
-        
-        for module in REQUIRED_MODULES:
-            try:
-                __import__(module)
-            except ImportError:
-                missing_modules.append(module)
-        
-        if missing_modules:
-            return False, f"Missing required modules: {', '.join(missing_modules)}"
-            
-        return True, None
+    # Check Python version
+    if sys.version_info < MIN_PYTHON_VERSION:
+        return False, f"Python {'.'.join(map(str, MIN_PYTHON_VERSION))} or higher is required"
+    
+    # Check required modules
+    missing_modules = []
+    
+    # find_spec only locates each module, it doesn't run its import-time code
+    for module in REQUIRED_MODULES:
+        if importlib.util.find_spec(module) is None:
+            missing_modules.append(module)
+    
+    if missing_modules:
+        return False, f"Missing required modules: {', '.join(missing_modules)}"
         
-    except Exception as e:
-        return False, f"Error checking requirements: {str(e)}"
+    return True, None
 
 def main():
     """Main application entry point"""
@@ -97,6 +92,14 @@ def main():
         
         # Check for updates (will be done from within the app to avoid circular imports)
         
+        from version import get_version_string
+        version_string = get_version_string()
+        print(version_string)
+        logger.info("Starting %s...", version_string)
+        
+        # Imported only once the requirements are known to be present
+        from program_tracker import ProgramTokiKanri
+        
         # Create and run program tracker
         logger.info("Creating program tracker instance")
         app = ProgramTokiKanri()
@@ -132,9 +135,6 @@ Please report this error to the developer."""
 
 if __name__ == "__main__":
     try:
-        version_string = get_version_string()
-        print(f"{version_string}")
-        logger.info(f"Starting {version_string}...")
         sys.exit(main())
     except Exception as e:
         logger.critical(f"Critical error: {Logger.format_error(e)}")
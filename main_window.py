@@ -40,11 +40,18 @@ STATUS_TRACKING_PREFIX = "Tracking: "
 STATUS_PAUSED_TEXT = "Tracking paused: No activity"
 SETTINGS_BUTTON_TEXT = "⚙"
 SEARCH_PLACEHOLDER = "Search programs..."
+SEARCH_DEBOUNCE_MS = 120  # Typing pause before the program list is filtered
 
 # Custom scrollbar class for dark mode support
 class DarkModeScrollbar(tk.Canvas):
     """A custom scrollbar implementation that supports dark mode styling"""
     
+    # (track, thumb, active thumb, button, arrow) colors, keyed by dark mode
+    THEME_COLORS = {
+        True: ("#1E1E2E", "#4B4B63", "#6B6B83", "#2D2D3F", "#AAAAAA"),
+        False: ("#DDDDDD", "#A3A3A3", "#777777", "#CCCCCC", "#555555"),
+    }
+    
     def __init__(self, parent, **kwargs):
         self.command = kwargs.pop('command', None)
         
@@ -69,14 +76,21 @@ class DarkModeScrollbar(tk.Canvas):
         self._dragging = False
         self._initial_thumb_top = 0  # Store initial thumb position for dragging
         self._initial_y = 0  # Store initial click position for dragging
+        self._height = -1  # Current height, kept by _on_configure to avoid winfo_height() calls
+        # Latest drag position, applied once per idle cycle by _flush_motion
+        self._pending_pos = None
+        self._motion_idle_id = None
         
         # Create the track, thumb, and arrow buttons
         self.track = self.create_rectangle(0, self.button_height, width, 1000-self.button_height, outline="")
         
         # Create rounded thumb (will be updated in update_thumb)
+        # Its vertical bounds are kept for hit-testing clicks without asking the canvas
+        self._thumb_top = self.button_height+3
+        self._thumb_bottom = self.button_height+self.thumb_min_height
         self.thumb = self.create_rounded_rectangle(
-            3, self.button_height+3, 
-            width-3, self.button_height+self.thumb_min_height, 
+            3, self._thumb_top, 
+            width-3, self._thumb_bottom, 
             self.thumb_radius
         )
         
@@ -118,40 +132,35 @@ class DarkModeScrollbar(tk.Canvas):
         # Bind events for track clicks (page up/down)
         self.tag_bind(self.track, "<ButtonPress-1>", self._on_track_click)
     
-    def create_rounded_rectangle(self, x1, y1, x2, y2, radius, **kwargs):
-        """Create a rounded rectangle"""
-        points = [
-            x1+radius, y1,
-            x2-radius, y1,
+    @staticmethod
+    def _rounded_rect_points(x1, y1, x2, y2, radius):
+        """Return the smoothed-polygon points for a rounded rectangle"""
+        # Each inset edge coordinate is used twice, compute it once
+        left, right = x1+radius, x2-radius
+        top, bottom = y1+radius, y2-radius
+        return [
+            left, y1,
+            right, y1,
             x2, y1,
-            x2, y1+radius,
-            x2, y2-radius,
+            x2, top,
+            x2, bottom,
             x2, y2,
-            x2-radius, y2,
-            x1+radius, y2,
+            right, y2,
+            left, y2,
             x1, y2,
-            x1, y2-radius,
-            x1, y1+radius,
+            x1, bottom,
+            x1, top,
             x1, y1
         ]
-        return self.create_polygon(points, **kwargs, smooth=True)
+    
+    def create_rounded_rectangle(self, x1, y1, x2, y2, radius, **kwargs):
+        """Create a rounded rectangle"""
+        return self.create_polygon(self._rounded_rect_points(x1, y1, x2, y2, radius), **kwargs, smooth=True)
     
     def configure_colors(self):
         """Configure colors based on current theme"""
-        if ModernStyle.is_dark_mode():
-            # Dark mode colors
-            self.track_color = "#1E1E2E"  # Dark background
-            self.thumb_color = "#4B4B63"  # Visible thumb
-            self.active_thumb_color = "#6B6B83"  # Lighter on hover
-            self.button_color = "#2D2D3F"  # Button background
-            self.arrow_color = "#AAAAAA"  # Arrow color
-        else:
-            # Light mode colors
-            self.track_color = "#DDDDDD"  # Light gray track
-            self.thumb_color = "#A3A3A3"  # Dark gray thumb
-            self.active_thumb_color = "#777777"  # Darker on hover
-            self.button_color = "#CCCCCC"  # Button background
-            self.arrow_color = "#555555"  # Arrow color
+        (self.track_color, self.thumb_color, self.active_thumb_color,
+         self.button_color, self.arrow_color) = self.THEME_COLORS[ModernStyle.is_dark_mode()]
         
         # Apply colors
         self.configure(bg=self.track_color)
@@ -165,9 +174,11 @@ class DarkModeScrollbar(tk.Canvas):
     
     def _on_configure(self, event):
         """Handle resize events"""
-        height = self.winfo_height()
-        if height <= 0:
+        height = event.height
+        # Tk also sends Configure when only the position changes, nothing to redraw then
+        if height <= 0 or height == self._height:
             return
+        self._height = height
             
         # Update track to fill the area between buttons
         self.coords(self.track, 0, self.button_height, self.width, height-self.button_height)
@@ -188,20 +199,14 @@ class DarkModeScrollbar(tk.Canvas):
         y = event.y
         
         # Ignore clicks on buttons
-        if y < self.button_height or y > self.winfo_height() - self.button_height:
+        if y < self.button_height or y > self._height - self.button_height:
             return
         
         # Check if click is directly on the thumb
-        # We need to check if the click is within the thumb's coordinates
-        thumb_id = self.find_closest(event.x, event.y)[0]
-        if thumb_id == self.thumb:
+        if self._thumb_top <= y <= self._thumb_bottom:
             self._dragging = True
             self._initial_y = y
-            
-            # Get current thumb position
-            thumb_coords = self.coords(self.thumb)
-            # For polygon (rounded rectangle), we need the second y-coordinate (index 3)
-            self._initial_thumb_top = thumb_coords[3]
+            self._initial_thumb_top = self._thumb_top
             
             self.current_thumb_color = self.active_thumb_color
             self.itemconfig(self.thumb, fill=self.current_thumb_color)
@@ -212,11 +217,9 @@ class DarkModeScrollbar(tk.Canvas):
     def _on_track_click(self, event):
         """Handle click on the track (not on thumb)"""
         y = event.y
-        thumb_coords = self.coords(self.thumb)
-        thumb_top = thumb_coords[1]
         
         # If click is above thumb, page up; if below, page down
-        if y < thumb_top:
+        if y < self._thumb_top:
             if self.command:
                 self.command("scroll", -1, "pages")
         else:
@@ -243,7 +246,7 @@ class DarkModeScrollbar(tk.Canvas):
             thumb_height = thumb_coords[-3] - thumb_coords[1]  # Using y-coordinates from the polygon
             
             # Calculate the relative position for moveto
-            height = self.winfo_height()
+            height = self._height
             if height <= 0:
                 return
                 
@@ -254,9 +257,17 @@ class DarkModeScrollbar(tk.Canvas):
             rel_pos = (new_y - thumb_height/2 - self.button_height) / scroll_height
             rel_pos = max(0.0, min(1.0, rel_pos))
             
-            # Update scrollbar position through command
-            if self.command:
-                self.command("moveto", rel_pos)
+            # Keep only the newest position; one moveto is issued when Tk goes idle
+            self._pending_pos = rel_pos
+            if self._motion_idle_id is None:
+                self._motion_idle_id = self.after_idle(self._flush_motion)
+    
+    def _flush_motion(self):
+        """Apply the latest drag position collected by _on_motion"""
+        self._motion_idle_id = None
+        rel_pos, self._pending_pos = self._pending_pos, None
+        if rel_pos is not None and self.command:
+            self.command("moveto", rel_pos)
     
     def _on_enter(self, event):
         """Handle mouse enter"""
@@ -280,8 +291,8 @@ class DarkModeScrollbar(tk.Canvas):
             self.command("scroll", 1, "units")
     
     def _update_thumb_from_absolute_y(self, y):
-        """Update thumb position from absolute y coordinate"""
-        height = self.winfo_height()
+        """Scroll so the thumb top sits at absolute canvas y (clamped to the track)"""
+        height = self._height
         if height <= 0:
             return
             
@@ -298,28 +309,9 @@ class DarkModeScrollbar(tk.Canvas):
         if self.command:
             self.command("moveto", rel_pos)
             
-    def _update_thumb_from_y(self, y):
-        """Update thumb position from mouse y coordinate"""
-        height = self.winfo_height()
-        if height <= 0:
-            return
-            
-        # Calculate available scrolling area
-        scroll_height = height - 2 * self.button_height
-        
-        # Constrain y to valid range
-        y = max(self.button_height, min(y, height - self.button_height))
-        
-        # Calculate relative position
-        rel_pos = (y - self.button_height) / scroll_height
-        
-        # Update scrollbar position through command
-        if self.command:
-            self.command("moveto", rel_pos)
-    
     def update_thumb(self):
         """Update thumb position and size based on current values"""
-        height = self.winfo_height()
+        height = self._height
         if height <= 0:
             return
             
@@ -337,22 +329,13 @@ class DarkModeScrollbar(tk.Canvas):
         # Ensure bottom position doesn't exceed bounds
         bottom_pos = min(bottom_pos, height - self.button_height)
         
-        # Delete old thumb and create new one with rounded corners
-        self.delete(self.thumb)
-        self.thumb = self.create_rounded_rectangle(
-            3, top_pos, 
-            self.width-3, bottom_pos, 
-            self.thumb_radius,
-            fill=self.current_thumb_color,
-            outline=""
+        # Move the existing thumb; mouse events reach it through the canvas bindings
+        self._thumb_top = top_pos
+        self._thumb_bottom = bottom_pos
+        self.coords(
+            self.thumb,
+            *self._rounded_rect_points(3, top_pos, self.width-3, bottom_pos, self.thumb_radius)
         )
-        
-        # Rebind events to the new thumb
-        self.tag_bind(self.thumb, "<ButtonPress-1>", self._on_press)
-        self.tag_bind(self.thumb, "<ButtonRelease-1>", self._on_release)
-        self.tag_bind(self.thumb, "<B1-Motion>", self._on_motion)
-        self.tag_bind(self.thumb, "<Enter>", self._on_enter)
-        self.tag_bind(self.thumb, "<Leave>", self._on_leave)
     
     def set(self, start, end):
         """Set scrollbar position (called by scrolled widget)"""
@@ -376,6 +359,7 @@ class MainWindow(BaseWidget):
         # Initialize search variables
         self._active_search = False
         self._current_search_text = ""
+        self._search_after_id = None
         
         # Set window size from config
         window_size = self.config.get("window_size", {"width": 400, "height": 600})
@@ -832,7 +816,20 @@ class MainWindow(BaseWidget):
             entry.bind('<FocusOut>', on_focus_out)
         
     def _filter_programs(self, event=None):
+        """Schedule filtering, so a burst of keystrokes reorders the list once"""
+        # Arrow, modifier and other keys that leave the text as it is need no refilter
+        search_text = self.search_var.get().lower()
+        if search_text == SEARCH_PLACEHOLDER.lower():
+            search_text = ""
+        if search_text == self._current_search_text:
+            return
+        if self._search_after_id is not None:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self._do_filter)
+        
+    def _do_filter(self):
         """Filter programs based on search text"""
+        self._search_after_id = None
         if not hasattr(self, 'program_gui') or not hasattr(self.program_gui, 'program_widgets'):
             return
             
@@ -843,11 +840,17 @@ class MainWindow(BaseWidget):
         self._current_search_text = "" if is_empty_search else search_text
         self._active_search = not is_empty_search
         
-        # Use the improved reorder_widgets method which now handles search filtering
-        self.program_gui.reorder_widgets(
-            self.parent.data_manager.get_current_times(),
-            self.parent.data_manager.currently_tracking
-        )
+        # Detach the scrollbar while widgets are repacked, then update it once
+        # Plain strings, so no new Tcl command is registered on every search
+        self.canvas.configure(yscrollcommand='')
+        try:
+            # Use the improved reorder_widgets method which now handles search filtering
+            self.program_gui.reorder_widgets(
+                self.parent.data_manager.get_current_times(),
+                self.parent.data_manager.currently_tracking
+            )
+        finally:
+            self.canvas.configure(yscrollcommand=self._yscroll_command)
         
         # Update canvas scroll region
         self._on_frame_configure()
@@ -892,8 +895,9 @@ class MainWindow(BaseWidget):
         # Explicitly configure colors to ensure proper initial appearance
         self.scrollbar.configure_colors()
         
-        # Configure canvas
+        # Configure canvas, keeping the registered Tcl command name so _do_filter can reattach it
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self._yscroll_command = self.canvas.cget('yscrollcommand')
         
         # Create frame for programs
         self.programs_frame = ttk.Frame(self.canvas, style="Modern.TFrame")
@@ -912,6 +916,10 @@ class MainWindow(BaseWidget):
             width=default_width
         )
         
+        # Wheel steps accumulated between idle cycles, see _queue_scroll
+        self._pending_scroll = 0
+        self._scroll_idle_id = None
+        
         # Configure scrolling
         self.programs_frame.bind("<Configure>", self._on_frame_configure)
         self.canvas.bind("<Configure>", self._on_canvas_configure)
@@ -970,7 +978,7 @@ class MainWindow(BaseWidget):
             
         # Only scroll if the content is larger than the canvas
         if self.programs_frame.winfo_height() > self.canvas.winfo_height():
-            self.canvas.yview_scroll(int(-1 * (event.delta / MOUSEWHEEL_SCROLL_UNITS)), "units")
+            self._queue_scroll(int(-1 * (event.delta / MOUSEWHEEL_SCROLL_UNITS)))
     
     def _on_mousewheel_macos(self, event):
         """Handle mousewheel scrolling on macOS"""
@@ -979,7 +987,7 @@ class MainWindow(BaseWidget):
             
         # macOS uses different scaling
         if self.programs_frame.winfo_height() > self.canvas.winfo_height():
-            self.canvas.yview_scroll(int(-1 * event.delta), "units")
+            self._queue_scroll(int(-1 * event.delta))
     
     def _on_mousewheel_linux_up(self, event):
         """Handle scroll up on Linux"""
@@ -987,7 +995,7 @@ class MainWindow(BaseWidget):
             return
             
         if self.programs_frame.winfo_height() > self.canvas.winfo_height():
-            self.canvas.yview_scroll(-1, "units")
+            self._queue_scroll(-1)
     
     def _on_mousewheel_linux_down(self, event):
         """Handle scroll down on Linux"""
@@ -995,7 +1003,20 @@ class MainWindow(BaseWidget):
             return
             
         if self.programs_frame.winfo_height() > self.canvas.winfo_height():
-            self.canvas.yview_scroll(1, "units")
+            self._queue_scroll(1)
+    
+    def _queue_scroll(self, units):
+        """Add wheel units to scroll; all steps since the last idle cycle are applied in one call"""
+        self._pending_scroll += units
+        if self._scroll_idle_id is None:
+            self._scroll_idle_id = self.canvas.after_idle(self._flush_scroll)
+    
+    def _flush_scroll(self):
+        """Scroll the canvas by the units collected by _queue_scroll"""
+        self._scroll_idle_id = None
+        units, self._pending_scroll = self._pending_scroll, 0
+        if units:
+            self.canvas.yview_scroll(units, "units")
 
     def _open_settings(self):
         """Open the settings window (singleton)."""
@@ -1104,12 +1125,14 @@ class MainWindow(BaseWidget):
             
     def update_ui_for_theme(self):
         """Update UI elements for the current theme"""
+        palette = ModernStyle.palette()
+        
         # Update window background
-        self.root.configure(bg=ModernStyle.get_bg_color())
+        self.root.configure(bg=palette.bg)
         
         # Update canvas background
         if hasattr(self, 'canvas'):
-            self.canvas.configure(bg=ModernStyle.get_bg_color())
+            self.canvas.configure(bg=palette.bg)
         
         # Update scrollbar colors
         if hasattr(self, 'scrollbar'):
@@ -1119,33 +1142,33 @@ class MainWindow(BaseWidget):
             else:
                 # Fallback for standard scrollbar
                 self.scrollbar.configure(
-                    bg=ModernStyle.get_card_bg(),
-                    troughcolor=ModernStyle.get_bg_color(),
-                    activebackground=ModernStyle.get_card_border()
+                    bg=palette.card_bg,
+                    troughcolor=palette.bg,
+                    activebackground=palette.card_border
                 )
         
         # Update button colors
         if hasattr(self, 'wide_select_button'):
             selecting = self.wide_select_button.cget('text') == SELECT_WINDOW_ACTIVE_TEXT
-            color = ModernStyle.get_button_toggle_color() if selecting else ModernStyle.get_success_color()
+            color = palette.button_toggle if selecting else palette.success
             self.wide_select_button.configure(bg=color, activebackground=color)
         if hasattr(self, 'narrow_select_button'):
             selecting = self.narrow_select_button.cget('text') == SELECT_WINDOW_ACTIVE_TEXT
-            color = ModernStyle.get_button_toggle_color() if selecting else ModernStyle.get_success_color()
+            color = palette.button_toggle if selecting else palette.success
             self.narrow_select_button.configure(bg=color, activebackground=color)
         
         # Update pin button
         if hasattr(self, 'toggle_button'):
             is_pinned = self.parent.always_on_top
-            color = ModernStyle.get_button_toggle_color() if is_pinned else ModernStyle.get_inactive_color()
+            color = palette.button_toggle if is_pinned else palette.inactive
             self.toggle_button.configure(bg=color, activebackground=color)
         
         # Update card frames
         if hasattr(self, 'total_time_frame') and hasattr(self.total_time_frame, '_border_canvas_obj'):
             canvas_obj = getattr(self.total_time_frame, '_border_canvas_obj')
             canvas_obj.configure(
-                highlightbackground=ModernStyle.get_card_border(),
-                bg=ModernStyle.get_card_bg()
+                highlightbackground=palette.card_border,
+                bg=palette.card_bg
             )
         
         # Update program cards
@@ -1154,8 +1177,8 @@ class MainWindow(BaseWidget):
                 if 'frame' in widgets and hasattr(widgets['frame'], '_border_canvas_obj'):
                     canvas_obj = getattr(widgets['frame'], '_border_canvas_obj')
                     canvas_obj.configure(
-                        highlightbackground=ModernStyle.get_card_border(),
-                        bg=ModernStyle.get_card_bg()
+                        highlightbackground=palette.card_border,
+                        bg=palette.card_bg
                     )
         
         # Update search entry and clear button if they exist
@@ -1168,13 +1191,13 @@ class MainWindow(BaseWidget):
                             for grandchild in child.winfo_children():
                                 if isinstance(grandchild, tk.Entry):
                                     try:
-                                        bg_color = ModernStyle.get_card_bg()
-                                        fg_color = ModernStyle.get_text_color()
+                                        bg_color = palette.card_bg
+                                        fg_color = palette.text
                                         grandchild.configure(
                                             bg=bg_color,
                                             fg=fg_color,
                                             insertbackground=fg_color,
-                                            highlightbackground=ModernStyle.get_card_border()
+                                            highlightbackground=palette.card_border
                                         )
                                     except tk.TclError:
                                         pass
@@ -1184,7 +1207,7 @@ class MainWindow(BaseWidget):
                                         if isinstance(button, tk.Label) and button.cget("text") == "✕":
                                             try:
                                                 button.configure(
-                                                    fg=ModernStyle.get_text_color(),
+                                                    fg=palette.text,
                                                     bg=bg_color  # Match the search entry background
                                                 )
                                             except tk.TclError:
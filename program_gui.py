@@ -171,6 +171,7 @@ class ProgramGUI(BaseWidget):
         self.programs_frame = frame
         self.program_widgets = {}
         self.last_sorted_programs = [] # To keep track of the last sort order
+        self._packed_frames = []  # Program frames in their current pack order
 
     @staticmethod
     def _format_program_name(name: str, custom_name: str | None = None) -> str:
@@ -344,6 +345,7 @@ class ProgramGUI(BaseWidget):
             if not any(isinstance(w, ttk.Label) and w.cget("text") == NO_PROGRAMS_TEXT for w in self.programs_frame.winfo_children()):
                 ttk.Label(self.programs_frame, text=NO_PROGRAMS_TEXT, style="Modern.TLabel").pack(pady=NO_PROGRAMS_PADY)
             self.last_sorted_programs = []
+            self._packed_frames = []
             return
         else:
             # Remove "No programs tracked yet" label if it exists
@@ -474,57 +476,60 @@ class ProgramGUI(BaseWidget):
         # Always get the sorted programs list (by time used)
         # Use a more efficient sorting approach
         sorted_items = sorted(current_times.items(), key=lambda x: x[1], reverse=True)
-        sorted_programs = [p for p, _ in sorted_items]
+        program_widgets = self.program_widgets
         
         # If there's an active search, filter the programs
         if has_active_search and search_text:
-            # First, unpack all widgets to start fresh
-            for program in self.program_widgets:
-                if 'frame' in self.program_widgets[program]:
-                    self.program_widgets[program]['frame'].pack_forget()
-            
-            # Filter and pack programs in the sorted order (already sorted by time)
-            visible_programs = []
-            for program in sorted_programs:
-                if program in self.program_widgets:
-                    widgets = self.program_widgets[program]
-                    if 'frame' not in widgets:
-                        continue
-                    
-                    # Get display name (including custom name if set)
-                    custom_name = self.parent.data_manager.get_display_name(program)
-                    program_name = self._format_program_name(program, custom_name).lower()
-                    
-                    # Only show programs that match the search
-                    if search_text in program_name:
-                        widgets['frame'].pack(fill=tk.X, pady=10)
-                        visible_programs.append(program)
-            
-            # Update the last sorted programs to match what we've just done
-            self.last_sorted_programs = visible_programs
-            
-            # Update displays without reordering again
-            self.update_displays(current_times, currently_tracking)
+            data_manager = self.parent.data_manager
+            visible_programs = [
+                program for program, _ in sorted_items
+                if program in program_widgets
+                # Get display name (including custom name if set)
+                and search_text in self._format_program_name(program, data_manager.get_display_name(program)).lower()
+            ]
         else:
-            # Always unpack all widgets first to ensure clean ordering
-            for program in self.program_widgets:
-                if 'frame' in self.program_widgets[program]:
-                    self.program_widgets[program]['frame'].pack_forget()
-            
-            # Pack widgets in the new sorted order (highest time to lowest)
-            for program in sorted_programs:
-                if program in self.program_widgets:
-                    self.program_widgets[program]['frame'].pack(fill=tk.X, pady=PROGRAM_FRAME_PADY)
-            
-            # Store current order
-            self.last_sorted_programs = sorted_programs[:] 
-            
+            visible_programs = [program for program, _ in sorted_items if program in program_widgets]
+        
+        # Only the part of the list that changed is repacked
+        if self._repack(visible_programs):
             # Update scroll region if canvas exists
             if hasattr(self.programs_frame, 'update_idletasks'):
                 self.programs_frame.update_idletasks()
-            
-            # Always update the display values
-            self.update_displays(current_times, currently_tracking)
+        
+        # Store current order
+        self.last_sorted_programs = visible_programs
+        
+        # Always update the display values
+        self.update_displays(current_times, currently_tracking)
+    
+    def _repack(self, programs):
+        """Pack the program frames in the given order, touching only what changed.
+        
+        Frames before the first difference from the current packing stay
+        as they are. Returns True if anything was repacked.
+        """
+        frames = [self.program_widgets[program]['frame'] for program in programs]
+        packed = self._packed_frames
+        if frames == packed:
+            return False
+        
+        # Length of the unchanged leading run
+        index = 0
+        for old, new in zip(packed, frames):
+            if old is not new:
+                break
+            index += 1
+        
+        # Frames of removed programs are already destroyed, only forget live ones
+        live = {widgets['frame'] for widgets in self.program_widgets.values()}
+        for frame in packed[index:]:
+            if frame in live:
+                frame.pack_forget()
+        for frame in frames[index:]:
+            frame.pack(fill=tk.X, pady=PROGRAM_FRAME_PADY)
+        
+        self._packed_frames = frames
+        return True
 
     def update_displays(self, current_times, currently_tracking):
         """Update all program displays (time, progress, active style).
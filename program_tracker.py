@@ -10,7 +10,7 @@ import win32process
 import psutil
 from main_window import MainWindow
 from mini_window import MiniWindow
-from activity_tracker import ActivityTracker
+from activity_tracker import ActivityTracker, ACTIVITY_POLL_BASE_MS
 from data_manager import DataManager
 from window_selector import WindowSelector
 from system_tray import SystemTrayIcon
@@ -329,12 +329,9 @@ class ProgramTokiKanri:
         
         # Periodic data saving
         current_time = time.time()
-        if current_time - self.last_save_time >= (self.config.get('save_interval') or 60):  # Default to 60 seconds if None
-            # Save data in background thread to prevent UI blocking
-            self.thread_manager.submit_task(
-                self.data_manager.save_data,
-                error_callback=lambda e: self.logger.error(f"Error saving data: {Logger.format_error(e)}")
-            )
+        if current_time - self.last_save_time >= self.config.save_interval:
+            # Saved on the data writer thread to prevent UI blocking
+            self.data_manager.request_save()
             self.last_save_time = current_time
             
     def _on_active_window_check_error(self, error):
@@ -347,18 +344,23 @@ class ProgramTokiKanri:
             return
             
         # Run activity check in background thread to prevent UI freezing
+        # The next check is scheduled from the completion callbacks using the tracker's suggested delay
         self.thread_manager.submit_task(
             self.activity_tracker.check_activity,
             callback=self._on_activity_check_complete,
             error_callback=self._on_activity_check_error
         )
             
+    def _schedule_activity_check(self, delay):
+        """Schedule the next activity check"""
         if not self.is_shutting_down:
-            # Check less frequently to reduce memory usage while still maintaining good responsiveness
-            self.main_window.root.after(200, self.check_activity) # Reduced polling frequency to prevent memory leaks
+            self.main_window.root.after(delay, self.check_activity)
             
-    def _on_activity_check_complete(self, activity_changed):
+    def _on_activity_check_complete(self, result):
         """Handle activity check completion"""
+        activity_changed, next_delay = result
+        self._schedule_activity_check(next_delay)
+        
         if activity_changed:
             self._handle_activity_change()
             # Reorder widgets to reflect new activity state without recreating
@@ -372,6 +374,7 @@ class ProgramTokiKanri:
     def _on_activity_check_error(self, error):
         """Handle activity check error"""
         self.logger.error(f"Error in activity check: {Logger.format_error(error)}")
+        self._schedule_activity_check(ACTIVITY_POLL_BASE_MS)
     
     def _handle_activity_change(self):
         """Handle changes in activity state"""
@@ -383,44 +386,14 @@ class ProgramTokiKanri:
                 self._update_status(False, self.data_manager.currently_tracking)
                 # Force an immediate update when activity stops
                 self._update_displays()
-                # Save data immediately when activity stops
-                self.data_manager.save_data()
+                # Save data as soon as activity stops
+                self.data_manager.request_save()
     
     def update_activity_tracker_settings(self):
         """Update ActivityTracker settings from config"""
-        # Get the latest settings from config
-        old_media_mode = self.activity_tracker.media_mode_enabled
-        old_require_playback = self.activity_tracker.require_media_playback
-        old_media_programs = self.activity_tracker.media_programs
-        
-        # Update settings from config
-        self.activity_tracker.inactivity_threshold = self.config.get('inactivity_threshold')
-        self.activity_tracker.media_mode_enabled = self.config.get('media_mode_enabled', False)
-        self.activity_tracker.require_media_playback = self.config.get('require_media_playback', True)
-        
-        # Make sure we get the latest media_programs list from the config
-        media_programs = self.config.get('media_programs', [])
-        if not media_programs:
-            media_programs = []
-            
-        self.activity_tracker.media_programs = media_programs
-        
-        # Log only significant changes
-        media_programs_changed = set(old_media_programs) != set(media_programs)
-        
-        if old_media_mode != self.activity_tracker.media_mode_enabled:
-            self.logger.info(f"Media mode changed: {old_media_mode} -> {self.activity_tracker.media_mode_enabled}")
-            
-        if old_require_playback != self.activity_tracker.require_media_playback:
-            self.logger.info(f"Require media playback changed: {old_require_playback} -> {self.activity_tracker.require_media_playback}")
-            if not self.activity_tracker.require_media_playback:
-                self.logger.info("Media programs will be considered active regardless of playback status")
-            else:
-                self.logger.info("Media programs will only be considered active when media is playing")
-                
-        # Only log media programs if they've changed or if media mode was just enabled
-        if media_programs_changed or (not old_media_mode and self.activity_tracker.media_mode_enabled):
-            self.activity_tracker.log_media_programs()
+        # The tracker follows Config changes through subscriptions, this resyncs
+        # after the whole config was replaced (initial load, reload_config)
+        self.activity_tracker.reload_settings()
                     
     def _update_displays(self):
         """Update all displays with current data"""
@@ -607,11 +580,8 @@ class ProgramTokiKanri:
         # Update status
         self._update_status(self.activity_tracker.is_active, process_name)
         
-        # Save data
-        self.thread_manager.submit_task(
-            self.data_manager.save_data,
-            error_callback=lambda e: self.logger.error(f"Error saving data: {Logger.format_error(e)}")
-        )
+        # Save data on the data writer thread
+        self.data_manager.request_save()
         
         # Reset selection state
         self.window_selector.selecting_window = False
@@ -877,8 +847,8 @@ class ProgramTokiKanri:
         try:
             self.is_shutting_down = True
             
-            # Save data synchronously before shutdown
-            self.data_manager.save_data()
+            # Save data synchronously before shutdown, including any pending debounced save
+            self.data_manager.flush()
             
             # Clean up Windows Media API resources before shutdown
             if hasattr(self, 'activity_tracker'):
@@ -434,11 +434,10 @@ class SettingsWindow(tk.Toplevel, BaseWidget):
             if not program_name:
                 return
                 
-            # Get current media programs
-            media_programs = self.config_manager.get("media_programs", [])
-            
             # Add the new program if it doesn't already exist
-            if program_name not in media_programs:
+            if program_name not in self.config_manager.get_media_programs():
+                # Copy the current media programs, set() ignores a value equal to the stored one
+                media_programs = list(self.config_manager.get("media_programs", []))
                 media_programs.append(program_name)
                 self.config_manager.set("media_programs", media_programs)
                 self._populate_media_programs()
@@ -457,8 +456,8 @@ class SettingsWindow(tk.Toplevel, BaseWidget):
             return
         selected_program = self.media_programs_listbox.get(selected_idx[0])
         
-        # Get current media programs
-        media_programs = self.config_manager.get("media_programs", [])
+        # Copy the current media programs, set() ignores a value equal to the stored one
+        media_programs = list(self.config_manager.get("media_programs", []))
         
         # Remove the selected program
         if selected_program in media_programs:
@@ -2,6 +2,14 @@
 import tkinter as tk
 from tkinter import ttk
 from typing import Optional, Callable, Any, Union
+from collections import namedtuple
+from functools import lru_cache
+
+# All colors of one theme, see ModernStyle.palette
+Palette = namedtuple('Palette', [
+    'bg', 'accent', 'text', 'inactive', 'success', 'button_remove', 'button_toggle',
+    'card_bg', 'card_border', 'card_shadow', 'card_active_border', 'input_bg'
+])
 
 class ModernStyle:
     """Class for managing application styling"""
@@ -64,6 +72,30 @@ class ModernStyle:
         """Check if dark mode is enabled"""
         return cls._dark_mode
     
+    @classmethod
+    def palette(cls):
+        """Return the colors of the current theme as a Palette, built once per theme"""
+        return cls._palette(cls._dark_mode)
+    
+    @classmethod
+    @lru_cache(maxsize=2)
+    def _palette(cls, dark_mode):
+        prefix = "DARK_" if dark_mode else ""
+        return Palette(
+            bg=getattr(cls, prefix + "BG_COLOR"),
+            accent=getattr(cls, prefix + "ACCENT_COLOR"),
+            text=getattr(cls, prefix + "TEXT_COLOR"),
+            inactive=getattr(cls, prefix + "INACTIVE_COLOR"),
+            success=getattr(cls, prefix + "SUCCESS_COLOR"),
+            button_remove=getattr(cls, prefix + "BUTTON_REMOVE_COLOR"),
+            button_toggle=getattr(cls, prefix + "BUTTON_TOGGLE_COLOR"),
+            card_bg=getattr(cls, prefix + "CARD_BG"),
+            card_border=getattr(cls, prefix + "CARD_BORDER"),
+            card_shadow=getattr(cls, prefix + "CARD_SHADOW"),
+            card_active_border=getattr(cls, prefix + "CARD_ACTIVE_BORDER"),
+            input_bg=getattr(cls, prefix + "INPUT_BG_COLOR"),
+        )
+    
     @classmethod
     def get_bg_color(cls):
         return cls.DARK_BG_COLOR if cls._dark_mode else cls.BG_COLOR
@@ -1,5 +1,25 @@
 # utils.py
+import json
+import os
 import time
+from pathlib import Path
+
+# Buffer size for data/config file I/O, larger than the 8 KiB default
+IO_BUFFER_SIZE = 64 * 1024
+
+# orjson is optional, fall back to the standard library json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# msgpack is optional, used for the compact tracked data file
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
 
 class TimeFormatter:
     """Utility class for time formatting"""
@@ -14,6 +34,59 @@ class TimeFormatter:
             return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
         return f"{minutes:02d}:{seconds:02d}"
 
+class FileUtils:
+    """Utility class for JSON/msgpack file reads and safe writes"""
+    @staticmethod
+    def dumps_json(data, indent=None):
+        """Serialize data to UTF-8 JSON bytes, using orjson when available.
+        
+        orjson only supports two-space indentation, so any indent gives
+        two spaces when it is used.
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        return json.dumps(data, indent=indent).encode('utf-8')
+        
+    @staticmethod
+    def read_json(path):
+        """Read and parse a JSON file, using orjson when available"""
+        with open(path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            raw = f.read()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(raw)
+        return json.loads(raw)
+        
+    @staticmethod
+    def dumps_msgpack(data):
+        """Serialize data to msgpack bytes (requires MSGPACK_AVAILABLE)"""
+        return msgpack.packb(data, use_bin_type=True)
+        
+    @staticmethod
+    def read_msgpack(path):
+        """Read and unpack a msgpack file (requires MSGPACK_AVAILABLE)"""
+        with open(path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+            return msgpack.unpackb(f.read(), raw=False)
+        
+    @staticmethod
+    def write_bytes_atomic(path, payload):
+        """Write payload so that path holds either the old or the new content.
+        
+        The bytes are written to a sibling temp file, flushed to disk, then moved
+        over path with os.replace, which is atomic on Windows and POSIX.
+        """
+        path = Path(path)
+        temp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(temp_path, 'wb', buffering=IO_BUFFER_SIZE) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        
+    @staticmethod
+    def write_json_atomic(path, data, indent=None):
+        """Write data as JSON atomically, see write_bytes_atomic"""
+        FileUtils.write_bytes_atomic(path, FileUtils.dumps_json(data, indent))
+
 class Timer:
     """Utility class for managing timing operations"""
     def __init__(self):
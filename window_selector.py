@@ -1,7 +1,7 @@
 # window_selector.py
 import win32gui
 import win32process
-import psutil
+from activity_tracker import get_process_name
 
 class WindowSelector:
     """Handles window selection and tracking."""
@@ -47,8 +47,7 @@ class WindowSelector:
             if hwnd and window_title and window_title not in our_app_titles:
                 try:
                     _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    process = psutil.Process(pid)
-                    process_name = process.name()
+                    process_name = get_process_name(pid)
 
                     # Already tracked – inform caller
                     if process_name in tracked_programs: